@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Check extract_issue_date on labelled date lines as they appear in SDS text.
+
+Usage: check_dates.py
+Exits non-zero if any line parses to the wrong date, e.g. because the label swallowed
+leading digits of the date.
+"""
+import sys
+
+from sds_parser_new.modules.date_parser import extract_issue_date
+
+CASES = (
+    ('Revision date: 2021-03-05', '2021-03-05'),
+    ('Revision date:2021-03-05', '2021-03-05'),
+    ('Issue Date: 16.Sep./2022', '2022-09-16'),
+    ('Issue Date: 18/05/2023', '2023-05-18'),
+    ('ISSUE DATE: 31/01/2022', '2022-01-31'),
+    ('Revision Date: 01/09/2022', '2022-09-01'),
+    ('Revision Date: SDS Number: Date of last issue: 11/25/2024', '2024-11-25'),
+    ('Revision date 08-Sep-2022', '2022-09-08'),
+    ('Issued: 15 April 2021', '2021-04-15'),
+    ('Date of issue: 8 September 2022', '2022-09-08'),
+    ('Revision Date March 5, 2021', '2021-03-05'),
+    ('Revision: 3.0 Date of issue: 01/02/2020', '2020-02-01'),
+    ('Print date 01/02/2020\nRevision Date\nPage 1 of 5\n03/04/2021', '2021-04-03'),
+)
+
+
+def main():
+    failures = 0
+    for text, expected in CASES:
+        got = extract_issue_date(text)
+        if got != expected:
+            failures += 1
+            print(f'FAIL {text!r}: expected {expected}, got {got}')
+        else:
+            print(f'ok   {text!r}')
+    print(f'{len(CASES) - failures}/{len(CASES)} date lines parse as expected')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Check that extract_text keeps sections 1 and 14 for every sample SDS.
+
+Usage: check_sections.py [<pdf_dir>]   (defaults to ../test-data/sds-pdfs)
+Exits non-zero if any PDF loses either section, e.g. because page extraction stopped early.
+"""
+from pathlib import Path
+import sys
+
+from sds_parser_new.modules.text_extractor import extract_text
+from sds_parser_new.modules.utils import get_section
+
+SECTIONS = (1, 14)
+
+
+def main():
+    pdf_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parent.parent / 'test-data' / 'sds-pdfs'
+    pdfs = sorted(p for p in pdf_dir.iterdir() if p.suffix.lower() == '.pdf')
+    if not pdfs:
+        print(f'No PDFs in {pdf_dir}')
+        sys.exit(1)
+    failures = 0
+    for pdf in pdfs:
+        text, error = extract_text(pdf)
+        missing = [n for n in SECTIONS if not get_section(text, n).strip()]
+        if missing:
+            failures += 1
+            detail = f' ({error[:100]})' if error else ''
+            print(f'FAIL {pdf.name}: missing section(s) {missing}{detail}')
+        else:
+            print(f'ok   {pdf.name}')
+    print(f'{len(pdfs) - failures}/{len(pdfs)} PDFs keep sections {SECTIONS}')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
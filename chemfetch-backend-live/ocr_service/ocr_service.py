@@ -46,28 +46,36 @@ except Exception as e:
     def convert_from_path(*args, **kwargs):  # dummy
         raise RuntimeError("OCR not available in lightweight mode")
 
+# Optional in-process Tesseract API: loads the engine once instead of a tesseract process per page
+try:
+    import tesserocr
+except Exception:
+    tesserocr = None
+
 
 # -----------------------------------------------------------------------------
 # Try to import parse_sds_pdf from the local module. Enhanced path handling.
 # -----------------------------------------------------------------------------
 try:
     # Method 1: Direct import when running from ocr_service directory
-    from parse_sds import parse_sds_pdf
+    from parse_sds import parse_sds_pdf, HTTP_SESSION, DOWNLOAD_TIMEOUT, DOWNLOAD_CHUNK_SIZE
     logger.info("Successfully imported parse_sds_pdf from parse_sds module")
 except ImportError:
     try:
         import sys
         current_dir = os.path.dirname(os.path.abspath(__file__))
         sys.path.insert(0, current_dir)
-        from parse_sds import parse_sds_pdf
+        from parse_sds import parse_sds_pdf, HTTP_SESSION, DOWNLOAD_TIMEOUT, DOWNLOAD_CHUNK_SIZE
         logger.info("Successfully imported parse_sds_pdf with path adjustment")
     except ImportError:
         try:
-            from ocr_service.parse_sds import parse_sds_pdf
+            from ocr_service.parse_sds import parse_sds_pdf, HTTP_SESSION, DOWNLOAD_TIMEOUT, DOWNLOAD_CHUNK_SIZE
             logger.info("Successfully imported parse_sds_pdf from ocr_service package")
         except ImportError as e:
             parse_sds_pdf = None
             _import_err = e
+            # Without parse_sds's pooled session, download with plain requests calls
+            HTTP_SESSION, DOWNLOAD_TIMEOUT, DOWNLOAD_CHUNK_SIZE = requests, 30, 128 * 1024
             logger.error(f"Failed to import parse_sds_pdf: {e}")
 
 # Also import the new SDS extractor directly for the HTTP endpoint
@@ -85,6 +93,17 @@ except ImportError:
         parse_pdf_direct = None
         _direct_import_err = e
 
+# OCR render settings shared with the parser (OCR_WORKERS respects the CPU affinity mask)
+try:
+    from sds_parser_new.modules.config import OCR_DPI, OCR_WORKERS
+    from sds_parser_new.modules.dependencies import tesserocr_set_image
+except ImportError:
+    OCR_DPI = 200
+    OCR_WORKERS = min(4, os.cpu_count() or 1)
+
+    def tesserocr_set_image(api, image, dpi):
+        api.SetImage(image)
+
 # Import quick parser as backup
 try:
     from quick_parser import parse_sds_from_text
@@ -151,15 +170,35 @@ def extract_text_from_pdf_with_ocr(pdf_path: Path, max_pages: int = 10) -> Tuple
     # OCR fallback
     try:
         logger.info("Low text content, attempting OCR...")
-        pages = convert_from_path(pdf_path, dpi=200, first_page=1, last_page=min(max_pages, 10))
-        ocr_text = ""
-        for i, page in enumerate(pages):
+        # OCR_DPI grayscale is plenty for SDS body text; pdftoppm renders page ranges in parallel
+        pages = convert_from_path(
+            pdf_path, dpi=OCR_DPI, grayscale=True, first_page=1, last_page=min(max_pages, 10),
+            thread_count=OCR_WORKERS,
+        )
+        api = None
+        if tesserocr is not None:
             try:
-                page_text = pytesseract.image_to_string(page, config='--psm 1')
-                ocr_text += f"\n--- Page {i+1} ---\n{page_text}"
+                # PSM.AUTO_OSD is the in-process equivalent of the '--psm 1' pytesseract config
+                api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.AUTO_OSD)
             except Exception as e:
-                logger.warning(f"OCR failed for page {i+1}: {e}")
-                continue
+                logger.warning(f"tesserocr initialisation failed, using pytesseract: {e}")
+        ocr_parts = []
+        try:
+            for i, page in enumerate(pages):
+                try:
+                    if api is not None:
+                        tesserocr_set_image(api, page, OCR_DPI)
+                        page_text = api.GetUTF8Text()
+                    else:
+                        page_text = pytesseract.image_to_string(page, config='--psm 1')
+                    ocr_parts.append(f"\n--- Page {i+1} ---\n{page_text}")
+                except Exception as e:
+                    logger.warning(f"OCR failed for page {i+1}: {e}")
+                    continue
+        finally:
+            if api is not None:
+                api.End()
+        ocr_text = "".join(ocr_parts)
         logger.info(f"Extracted {len(ocr_text)} characters using OCR")
         return ocr_text, True
     except Exception as e:
@@ -180,10 +219,10 @@ except Exception:
         fitz = None  # ensure the name exists module-wide
 
 
-def extract_text_from_pdf_multiple_methods(pdf_path: Path, max_pages: int = 10) -> Tuple[str, bool]:
+def extract_text_from_pdf_multiple_methods(pdf_path: Path, max_pages: Optional[int] = 10) -> Tuple[str, bool]:
     """
     Extract text from PDF using multiple methods for maximum compatibility.
-    Returns (text, is_image_only_pdf)
+    Returns (text, is_image_only_pdf). ``max_pages=None`` reads every page.
     """
     text = ""
 
@@ -193,8 +232,7 @@ def extract_text_from_pdf_multiple_methods(pdf_path: Path, max_pages: int = 10)
         try:
             # context manager ensures the document is closed even on exceptions
             with fitz.open(str(pdf_path)) as doc:
-                for page in doc:
-                    text += page.get_text()
+                text = "".join(page.get_text() for page in doc)
             if len(text.strip()) >= 50:
                 logger.info(f"Extracted {len(text)} characters using PyMuPDF")
                 return text, False
@@ -207,10 +245,9 @@ def extract_text_from_pdf_multiple_methods(pdf_path: Path, max_pages: int = 10)
         try:
             import pdfplumber
             with pdfplumber.open(pdf_path) as pdf:
-                for page_num in range(min(len(pdf.pages), max_pages)):
-                    page = pdf.pages[page_num]
-                    page_text = page.extract_text() or ""
-                    text += page_text
+                text += "".join(
+                    page.extract_text() or "" for page in pdf.pages[:max_pages]
+                )
             if len(text.strip()) >= 50:
                 logger.info(f"Extracted {len(text)} characters using pdfplumber")
                 return text, False
@@ -220,7 +257,7 @@ def extract_text_from_pdf_multiple_methods(pdf_path: Path, max_pages: int = 10)
     # Method 3: pdfminer.six
     try:
         with open(pdf_path, 'rb') as f:
-            text = pdfminer_extract_text(f, maxpages=max_pages)
+            text = pdfminer_extract_text(f, maxpages=max_pages or 0)  # 0 = no limit
         if len(text.strip()) >= 50:
             logger.info(f"Extracted {len(text)} characters using pdfminer.six")
             return text, False
@@ -335,11 +372,12 @@ def verify_pdf_sds(url: str, product_name: str, keywords=None) -> Dict[str, Any]
     ]
 
     try:
-        response = requests.get(url, timeout=30, stream=True)
+        response = HTTP_SESSION.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True)
         response.raise_for_status()
         content_type = response.headers.get('content-type', '').lower()
         if 'pdf' not in content_type:
             logger.info(f"Not a PDF: {content_type}")
+            response.close()  # don't leave the pooled connection checked out on an unread body
             return {"verified": False, "error": "Not a PDF file", "used_ocr": False,
                     "image_only_pdf": False, "text_length": 0, "keyword_matches": 0}
 
@@ -347,10 +385,11 @@ def verify_pdf_sds(url: str, product_name: str, keywords=None) -> Dict[str, Any]
         with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
             size = 0
             logger.info(f"Starting PDF download with {max_size // (1024*1024)}MB limit...")
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 size += len(chunk)
                 if size > max_size:
                     logger.warning(f"PDF too large: {size} bytes")
+                    response.close()
                     os.unlink(tmp_file.name)
                     return {"verified": False, "error": "PDF file too large", "used_ocr": False,
                             "image_only_pdf": False, "text_length": 0, "keyword_matches": 0}
@@ -470,20 +509,15 @@ def parse_sds_http():
         if not text:
             # fallback: download and extract again
             with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                response = requests.get(pdf_url, timeout=30, stream=True)
+                response = HTTP_SESSION.get(pdf_url, timeout=DOWNLOAD_TIMEOUT, stream=True)
                 response.raise_for_status()
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     tmp_file.write(chunk)
                 tmp_path = Path(tmp_file.name)
             try:
-                # Try pdfplumber first if available; otherwise use multi-method
-                try:
-                    import pdfplumber
-                    with pdfplumber.open(tmp_path) as pdf:
-                        for page in pdf.pages:
-                            text += page.extract_text() or ""
-                except Exception:
-                    text, _ = extract_text_from_pdf_multiple_methods(tmp_path, max_pages=10)
+                # PyMuPDF first (far faster than pdfplumber for raw text), pdfplumber/pdfminer as fallbacks;
+                # every page, so Section 14 (DG class, packing group) is reached on long SDSs
+                text, _ = extract_text_from_pdf_multiple_methods(tmp_path, max_pages=None)
             finally:
                 if 'tmp_path' in locals() and tmp_path.exists():
                     os.unlink(tmp_path)
@@ -563,9 +597,9 @@ def parse_pdf_direct_http():
 
     try:
         with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-            response = requests.get(pdf_url, timeout=30, stream=True)
+            response = HTTP_SESSION.get(pdf_url, timeout=DOWNLOAD_TIMEOUT, stream=True)
             response.raise_for_status()
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 tmp_file.write(chunk)
             tmp_path = Path(tmp_file.name)
         try:
@@ -9,6 +9,8 @@ import json
 import argparse
 import tempfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -37,15 +39,31 @@ except ImportError as e:
 
     logger.warning("[PARSE_SDS] Using fallback parse function")
 
+# PDF download settings, shared with ocr_service.py's endpoints.
+# Streamed PDF downloads are read in 128 KiB chunks; 8 KiB chunks spent more time in
+# per-chunk Python overhead than on the network
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+# (connect, read) seconds
+DOWNLOAD_TIMEOUT = (5, 30)
+
+# One pooled session for all PDF downloads: repeat requests to the same SDS host reuse the
+# TCP/TLS connection, and transient 429/5xx responses are retried with backoff. The final
+# response is still returned (raise_on_status=False) so raise_for_status reports it as before.
+HTTP_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(pool_maxsize=16, max_retries=Retry(
+    total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False))
+HTTP_SESSION.mount("https://", _http_adapter)
+HTTP_SESSION.mount("http://", _http_adapter)
+
 
 def download_pdf(url: str, temp_dir: Path) -> Optional[Path]:
     """Download PDF from URL to temporary file."""
     try:
         logger.info(f"[PARSE_SDS] Starting PDF download from: {url}")
-        logger.info(f"[PARSE_SDS] Download timeout: 30 seconds")
+        logger.info(f"[PARSE_SDS] Download timeout: {DOWNLOAD_TIMEOUT[0]}s connect, {DOWNLOAD_TIMEOUT[1]}s read")
         logger.info(f"[PARSE_SDS] Temp directory: {temp_dir}")
         
-        response = requests.get(url, timeout=30, stream=True)
+        response = HTTP_SESSION.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True)
         logger.info(f"[PARSE_SDS] HTTP response status: {response.status_code}")
         response.raise_for_status()
         
@@ -64,7 +82,7 @@ def download_pdf(url: str, temp_dir: Path) -> Optional[Path]:
         
         downloaded_bytes = 0
         with open(temp_file, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                 f.write(chunk)
                 downloaded_bytes += len(chunk)
                 if downloaded_bytes % (1024 * 1024) == 0:  # Log every MB
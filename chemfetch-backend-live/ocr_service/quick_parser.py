@@ -7,15 +7,10 @@ from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
-def parse_sds_from_text(text: str, product_id: int) -> Dict[str, Any]:
-    """
-    Extract SDS information from already-extracted text.
-    Uses simple regex patterns to find key information.
-    """
-    logger.info(f"[QUICK_PARSER] Parsing SDS text ({len(text)} chars) for product {product_id}")
-    
-    # Basic field extraction patterns
-    patterns = {
+# Basic field extraction patterns, compiled once; within a field the first pattern that matches wins
+_FIELD_PATTERNS = {
+    field: tuple(re.compile(pattern, re.IGNORECASE) for pattern in field_patterns)
+    for field, field_patterns in {
         'vendor': [
             r'(?:Manufacturer|Company|Supplier):\s*([^\n\r]+)',
             r'Details of the supplier[^\n]*\n([^\n]+)',
@@ -33,7 +28,16 @@ def parse_sds_from_text(text: str, product_id: int) -> Dict[str, Any]:
             r'Packing group[^\n]*:\s*(I{1,3}|IV|V)',
             r'PG[^\n]*:\s*(I{1,3}|IV|V|\d+)'
         ]
-    }
+    }.items()
+}
+
+
+def parse_sds_from_text(text: str, product_id: int) -> Dict[str, Any]:
+    """
+    Extract SDS information from already-extracted text.
+    Uses simple regex patterns to find key information.
+    """
+    logger.info(f"[QUICK_PARSER] Parsing SDS text ({len(text)} chars) for product {product_id}")
     
     # Extract fields
     result = {
@@ -56,9 +60,9 @@ def parse_sds_from_text(text: str, product_id: int) -> Dict[str, Any]:
     }
     
     # Apply patterns
-    for field, field_patterns in patterns.items():
-        for pattern in field_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+    for field, field_patterns in _FIELD_PATTERNS.items():
+        for rx in field_patterns:
+            match = rx.search(text)
             if match:
                 value = match.group(1).strip()
                 result[field] = value
@@ -1,14 +1,17 @@
 """
 Configuration and constants for SDS parser
 """
+import os
 import re
 
 # Patterns for parsing
 SECTION_PATTERN = re.compile(r'^\s*(?:section\s*)?(\d{1,2})(?:\s|:|\.)(?=\s)', re.IGNORECASE | re.MULTILINE)
 
 DATE_PATTERN = re.compile(
-    r'(\b(?:Revision(?:\s*Date)?|Issue\s*Date|Date\s*of\s*issue|Version\s*date|SDS\s*creation\s*date|SDS\s*date|Date\s*Prepared|Prepared\s*on|Prepared|Issued|Printed\s*on|Print\s*date|Printing\s*date)[^\n]{0,40})\s*[:]?\s*(?:\nPage[^\n]*\n)?\s*'
-    r'('
+    r'(\b(?:Revision(?:\s*Date)?|Issue\s*Date|Date\s*of\s*issue|Version\s*date|SDS\s*creation\s*date|SDS\s*date|Date\s*Prepared|Prepared\s*on|Prepared|Issued|Printed\s*on|Print\s*date|Printing\s*date)[^\n]{0,40}?)\s*[:]?\s*(?:\nPage[^\n]*\n)?\s*'
+    # Lazy label and a word boundary: the date is the first whole token after the label, so
+    # the label never swallows its leading digits ("2021-03-05" read as "21-03-05")
+    r'\b('
     r'(?:\d{1,2}[\/-]\d{1,2}[\/-]\d{2,4})'                         # 01/09/2022 or 09-01-22
     r'|(?:\d{4}-\d{2}-\d{2})'                                          # 2022-09-01
     r'|(?:[A-Za-z]+\.?\s+\d{1,2},?\s*\d{4})'                          # Sep 1, 2022 / September 1 2022
@@ -143,3 +146,55 @@ VALID_PACKING_GROUPS = re.compile(r'^(?:I{1,3}|IV?|N\.?/?A\.?|None|Not\s+(?:appl
 
 # Minimum text length before triggering OCR fallback
 MIN_TEXT_LENGTH = 50
+
+# Text length at which the first (fastest) extractor's output is accepted as-is,
+# skipping the slower pdfplumber/pdfminer comparison passes
+SUFFICIENT_TEXT_LENGTH = 2000
+# ...or at least this many characters per page read, for documents of only a page or two
+SUFFICIENT_TEXT_PER_PAGE = 200
+
+# Upper bound on extracted text (far more than any real SDS); extraction stops at the page
+# that crosses it so malformed or enormous PDFs cannot exhaust memory
+MAX_TEXT_CHARS = 500_000
+
+# Text-layer density (characters per square point of page area) below which a page counts as an
+# image: real SDS text pages sit around 0.002-0.01, scans and cover images near 0. The first
+# TEXT_DENSITY_SAMPLE_PAGES pages decide whether a whole document is routed straight to OCR.
+TEXT_DENSITY_THRESHOLD = 0.001
+TEXT_DENSITY_SAMPLE_PAGES = 3
+
+# Directory for the on-disk parse_pdf result cache (keyed by file content); unset disables it
+RESULT_CACHE_DIR = os.getenv("SDS_CACHE_DIR") or None
+
+# OCR renders and recognises pages in order, OCR_RUN_PAGES at a time, stopping one run after
+# sections 1 and 14 are complete. Section 14 is not reliably near the end (long SDSs append
+# annexes or repeat sections), so there is no fixed back window; OCR_MAX_PAGES bounds the work.
+OCR_RUN_PAGES = 8
+OCR_MAX_PAGES = 40
+
+# Render resolution for OCR images (grayscale); 200 DPI keeps Tesseract accurate on SDS body text
+OCR_DPI = 200
+
+# Binarise OCR images with a global Otsu threshold before handing them to Tesseract
+OCR_BINARIZE = True
+
+# Tesseract settings. PSM 6 treats the page as one uniform text block (no orientation/script
+# detection pass, keeps label/value rows together); PSM 4 suits two-column layouts better.
+# OEM 1 runs the LSTM engine only, skipping legacy engine initialisation.
+OCR_LANG = 'eng'
+OCR_PSM = 6
+OCR_OEM = 1
+OCR_TESSERACT_CONFIG = f'--psm {OCR_PSM} --oem {OCR_OEM} -l {OCR_LANG}'
+
+# CPUs this process may actually run on. The affinity mask honours container cpusets, which
+# os.cpu_count() ignores (it reports every CPU on the host).
+AVAILABLE_CPUS = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+
+# Pages OCR'd concurrently by the pytesseract fallback, which runs one tesseract process per page
+# (or per batch), so threads are enough to spread pages over cores; kept small for the 512MB
+# Render instance. The preferred tesserocr engine is one shared, locked API and runs serially.
+OCR_WORKERS = min(4, AVAILABLE_CPUS)
+
+# Without tesserocr, pytesseract starts a tesseract process per call; runs of at least this many
+# pages are OCR'd with one process per worker over an image-list file, so it initialises once
+OCR_BATCH_MIN_PAGES = 3
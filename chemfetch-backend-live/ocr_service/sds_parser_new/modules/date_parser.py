@@ -2,52 +2,96 @@
 Date parsing module
 """
 import logging
+import re
+from datetime import date, datetime
 from typing import Optional, List
 from .config import DATE_PATTERN
 
+# Optional: only dates outside the fixed shapes below need dateutil
+try:
+    from dateutil import parser as dateparser
+except ImportError:  # pragma: no cover
+    dateparser = None
+
 logger = logging.getLogger(__name__)
 
+# Fixed-shape candidates are parsed directly; anything else falls back to dateutil.
+# Four-digit years only: dateutil pivots two-digit years around the current year, strptime at 1969.
+_RE_NUMERIC_DATE = re.compile(r'([0-9]{1,2})([/-])([0-9]{1,2})\2([0-9]{4})')
+_RE_ISO_DATE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+# "Sep 1, 2022", "1 Sep 2022" and "08-Sep-2022" as DATE_PATTERN captures them
+_RE_NAMED_MONTH_DATE = re.compile(
+    r'[A-Za-z]+\.?\s+[0-9]{1,2},?\s*[0-9]{4}'
+    r'|[0-9]{1,2}\s+[A-Za-z]+\.?\s+[0-9]{4}'
+    r'|[0-9]{1,2}[\-/.][A-Za-z]{3,}\.?[\-/.][0-9]{4}')
+_RE_DATE_SEPARATORS = re.compile(r'\.?[\s,\-/.]+')
+_NAMED_MONTH_FORMATS = ('%d %b %Y', '%d %B %Y', '%b %d %Y', '%B %d %Y')
+
+
+def _parse_fixed_shape(candidate: str) -> Optional[date]:
+    """Parse the common DATE_PATTERN shapes without dateutil; None if the candidate needs it.
+
+    Numeric dates are day-first (Australian DD/MM/YYYY); a month above 12 is left to dateutil,
+    which swaps day and month.
+    """
+    m = _RE_NUMERIC_DATE.fullmatch(candidate)
+    if m:
+        try:
+            return date(int(m.group(4)), int(m.group(3)), int(m.group(1)))
+        except ValueError:
+            return None
+    m = _RE_ISO_DATE.fullmatch(candidate)
+    if m:
+        try:
+            return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        except ValueError:
+            return None
+    if _RE_NAMED_MONTH_DATE.fullmatch(candidate):
+        normalized = " ".join(_RE_DATE_SEPARATORS.split(candidate))
+        for fmt in _NAMED_MONTH_FORMATS:
+            try:
+                return datetime.strptime(normalized, fmt).date()
+            except ValueError:
+                continue
+    return None
+
 
 def extract_issue_date(text: str) -> Optional[str]:
     """Extract and parse issue date from SDS text."""
-    matches = list(DATE_PATTERN.finditer(text))
     chosen = None
-    
-    if matches:
+    today = date.today()
+    # Matched lazily: the scan stops at the first issue/revision-style date instead of
+    # collecting every date-like match in the document first
+    for m in DATE_PATTERN.finditer(text):
+        label = m.group(1).lower()
+        candidate = m.group(2).strip()
+        
         try:
-            from datetime import date
-            from dateutil import parser as dateparser
+            # Parse with dayfirst=True for Australian format (DD/MM/YYYY)
+            d = _parse_fixed_shape(candidate)
+            if d is None:
+                if dateparser is None:
+                    logger.warning(f"[SDS_EXTRACTOR] python-dateutil not available, skipping date '{candidate}'")
+                    continue
+                d = dateparser.parse(candidate, dayfirst=True).date()
+            if d > today:  # Skip future dates
+                continue
+            
+            # Normalize month abbreviations with trailing dot (e.g., Jan.)
+            candidate = candidate.replace('Jan.', 'Jan').replace('Feb.', 'Feb').replace('Mar.', 'Mar').replace('Apr.', 'Apr').replace('Jun.', 'Jun').replace('Jul.', 'Jul').replace('Aug.', 'Aug').replace('Sep.', 'Sep').replace('Oct.', 'Oct').replace('Nov.', 'Nov').replace('Dec.', 'Dec')
+            # Convert to ISO format
+            chosen_iso = d.strftime('%Y-%m-%d')
+            logger.info(f"[SDS_EXTRACTOR] Parsed date '{candidate}' as {d} -> ISO: {chosen_iso}")
             
-            today = date.today()
-            for m in matches:
-                label = m.group(1).lower()
-                candidate = m.group(2).strip()
+            # Prefer issue/revision/prepared/issued/creation/version/sds over print
+            if any(key in label for key in ['issue', 'prepared', 'issued', 'creation', 'revision', 'version', 'sds']):
+                chosen = chosen_iso
+                break
+            if not chosen:
+                chosen = chosen_iso
                 
-                try:
-                    # Parse with dayfirst=True for Australian format (DD/MM/YYYY)
-                    d = dateparser.parse(candidate, dayfirst=True).date()
-                    if d > today:  # Skip future dates
-                        continue
-                    
-                    # Normalize month abbreviations with trailing dot (e.g., Jan.)
-                    candidate = candidate.replace('Jan.', 'Jan').replace('Feb.', 'Feb').replace('Mar.', 'Mar').replace('Apr.', 'Apr').replace('Jun.', 'Jun').replace('Jul.', 'Jul').replace('Aug.', 'Aug').replace('Sep.', 'Sep').replace('Oct.', 'Oct').replace('Nov.', 'Nov').replace('Dec.', 'Dec')
-                    # Convert to ISO format
-                    chosen_iso = d.strftime('%Y-%m-%d')
-                    logger.info(f"[SDS_EXTRACTOR] Parsed date '{candidate}' as {d} -> ISO: {chosen_iso}")
-                    
-                    # Prefer issue/revision/prepared/issued/creation/version/sds over print
-                    if any(key in label for key in ['issue', 'prepared', 'issued', 'creation', 'revision', 'version', 'sds']):
-                        chosen = chosen_iso
-                        break
-                    if not chosen:
-                        chosen = chosen_iso
-                        
-                except Exception as e:
-                    logger.warning(f"[SDS_EXTRACTOR] Failed to parse date '{candidate}': {e}")
-                    continue
-                    
-        except ImportError:
-            logger.warning("[SDS_EXTRACTOR] python-dateutil not available, skipping date parsing")
-            chosen = None
-    
+        except Exception as e:
+            logger.warning(f"[SDS_EXTRACTOR] Failed to parse date '{candidate}': {e}")
+            continue
+
     return chosen
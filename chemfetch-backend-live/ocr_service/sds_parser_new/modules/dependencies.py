@@ -2,6 +2,10 @@
 Dependency imports and availability checks
 """
 import logging
+import threading
+from typing import Optional
+
+from .config import OCR_DPI, OCR_LANG, OCR_OEM, OCR_PSM
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
@@ -25,6 +29,63 @@ except ImportError:
     OCR_AVAILABLE = False
     logger.info("[SDS_EXTRACTOR] pytesseract not available")
 
+# In-process Tesseract API - avoids pytesseract's per-page subprocess and temp files
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+    logger.info("[SDS_EXTRACTOR] tesserocr available")
+except ImportError:
+    tesserocr = None
+    TESSEROCR_AVAILABLE = False
+    logger.info("[SDS_EXTRACTOR] tesserocr not available")
+
+# One tesserocr API per process, created on first use and shared by every OCR path: only one
+# LSTM model stays resident on the 512MB instance. The lock serialises SetImage/GetUTF8Text pairs.
+_tess_api = None
+_tess_api_failed = False
+_tess_lock = threading.Lock()
+
+
+def tesserocr_set_image(api, image, dpi: int) -> None:
+    """Hand a PIL page image to a tesserocr API.
+
+    8-bit grayscale pixels go in raw through SetImageBytes, which skips the in-memory
+    encode/decode SetImage does for PIL images; other modes use SetImage.
+    """
+    if image.mode == "L":
+        width, height = image.size
+        api.SetImageBytes(image.tobytes(), width, height, 1, width)
+        api.SetSourceResolution(dpi)
+    else:
+        api.SetImage(image)
+
+
+def tesserocr_ready() -> bool:
+    """True if OCR can go through the shared in-process tesserocr API."""
+    return bool(TESSEROCR_AVAILABLE and tesserocr and not _tess_api_failed)
+
+
+def tesserocr_ocr(image) -> Optional[str]:
+    """OCR one page image (rendered at OCR_DPI) with the shared tesserocr API.
+
+    The API is configured from OCR_LANG/OCR_PSM/OCR_OEM, the same settings as the pytesseract
+    fallback's OCR_TESSERACT_CONFIG. Returns None if tesserocr is missing or cannot initialise,
+    so the caller can fall back to pytesseract.
+    """
+    global _tess_api, _tess_api_failed
+    if not tesserocr_ready():
+        return None
+    with _tess_lock:
+        if _tess_api is None:
+            try:
+                _tess_api = tesserocr.PyTessBaseAPI(lang=OCR_LANG, psm=OCR_PSM, oem=OCR_OEM)
+            except Exception as e:
+                _tess_api_failed = True
+                logger.warning(f"[SDS_EXTRACTOR] tesserocr initialisation failed, using pytesseract: {e}")
+                return None
+        tesserocr_set_image(_tess_api, image, OCR_DPI)
+        return _tess_api.GetUTF8Text()
+
 try:
     from pdf2image import convert_from_path
     PDF2IMAGE_AVAILABLE = True
@@ -34,6 +95,16 @@ except ImportError:
     PDF2IMAGE_AVAILABLE = False
     logger.info("[SDS_EXTRACTOR] pdf2image not available")
 
+# PDFium bindings - fast raw text extraction without pdfplumber's layout objects
+try:
+    import pypdfium2 as pdfium
+    PYPDFIUM2_AVAILABLE = True
+    logger.info("[SDS_EXTRACTOR] pypdfium2 available")
+except ImportError:
+    pdfium = None
+    PYPDFIUM2_AVAILABLE = False
+    logger.info("[SDS_EXTRACTOR] pypdfium2 not available")
+
 # Fallback to pdfplumber for text extraction
 try:
     import pdfplumber
@@ -2,8 +2,11 @@
 Improved Field extraction module - fixes for specific SDS parsing issues
 """
 import re
+import functools
 import logging
-from typing import List, Optional
+from collections import Counter
+from datetime import date, datetime
+from typing import List, Optional, Pattern, Tuple
 
 from .config import FIELD_LABELS
 from .utils import (
@@ -18,42 +21,193 @@ from .config import VALID_PACKING_GROUPS
 
 logger = logging.getLogger(__name__)
 
+# Fragments that continue a label header ("Recommended use" + "of the chemical and ...")
+# rather than carry a value; one alternation so each check is a single fullmatch
+_RE_HEADER_CONTINUATION = re.compile('|'.join(f'(?:{p})' for p in (
+    r"^of\s+the\s+chemical\s+and\s+restrictions\s+on\s+use$",
+    r"^of\s+the\s+safety\s+data\s+sheet$",
+    r"^or\s+supplier'?s\s+details$",
+    r"^of\s+the\s+company/undertaking$",
+)), re.IGNORECASE)
+# Table cells: runs of 2+ spaces, tabs or pipes (single spaces stay inside a cell)
+_RE_TABLE_CELL_SPLIT = re.compile(r'\s{2,}|\t|\|')
+# extract_after_label value cleanup, applied to every label hit
+_RE_WHOLE_VALUE = re.compile(r"^(.+)$")
+_RE_POSSESSIVE_PREFIX = re.compile(r"^[\"''`]+s\b\s*")
+_RE_USE_LABEL_CONTINUATION = re.compile(
+    r'^(?:of\s+the\s+(?:substance|chemical)(?:\s*/\s*mixture|\s+or\s+mixture)?)(?:\s+and\s+uses\s+advised\s+against)?\s*[:\-]*\s*',
+    re.IGNORECASE)
+# Case-sensitive: these were historically called with re.IGNORECASE in the count position
+_RE_OF_THE_SDS_PREFIX = re.compile(r"^of\s+the\s+safety\s+data\s+sheet\s*")
+_RE_OF_THE_SUBSTANCE_PREFIX = re.compile(r"^of\s+the\s+substance\s+or\s+mixture\s+and\s+uses\s+advised\s+against\s*")
+_RE_PRODUCT_CODE = re.compile(r"product\s+code", re.IGNORECASE)
+# Separators that end a value (contact details or another label on the same line), in priority order
+_VALUE_SEPARATORS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\s+Tel:', r'\s+Phone:', r'\s+Fax:', r'\s+Email:', r'\s+Website:',
+    r'\s+Emergency:', r'\s+Address:', r'\s+Contact:', r'\s+Product\s+code:',
+    # Guard: if another label starts on same line, trim at that point
+    r'\s+Intended\s+use\b', r'\s+Identified\s+uses\b', r'\s+Uses\s+advised\s+against\b',
+    r'\s+Use\s+of\s+the\s+substance\b', r'\s+Restrictions\s+on\s+use\b',
+)]
+_RE_TRAILING_SEPARATOR = re.compile(r'\s*[:\-]\s*$')
+_RE_PAGE_NUMBER_TAIL = re.compile(r'\s+Page\s+\d+.*$', re.IGNORECASE)
+_RE_REGISTRATION_NO = re.compile(r'^registration\s+no\.?', re.IGNORECASE)
+_RE_SECTION_HEADER_START = re.compile(r'^\s*(?:section\s*)?\d', re.IGNORECASE)
+# extract_date_from_header: labelled dates in page headers/footers, in priority order
+_HEADER_DATE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Generic Revision / Rev / Date labels
+    r'Revision(?:\s*Date)?[:\s]+(\d{4}-\d{2}-\d{2})',
+    r'Revision(?:\s*Date)?[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'Revision(?:\s*Date)?[:\s]+(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})',
+    r'Rev[:\s]+(\d{4}-\d{2}-\d{2})',
+    r'Rev[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'Rev[:\s]+(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})',
+    r'Date[:\s]+(\d{4}-\d{2}-\d{2})',
+    r'Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'Date[:\s]+(\d{1,2}\s+[A-Za-z]{3,}\.?\s+\d{2,4})',
+    # Header/footer variants
+    r'Printing\s+date[:\s]+(\d{1,2}\s+[A-Za-z]{3,}\.?\s+\d{4})',
+    r'Printed\s+on[:\s]+(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})',
+)]
+_RE_MONTH_ABBREV_DOT = re.compile(r'\b([A-Za-z]{3,})\.')
+# extract_from_table_structure: Section 14 table headers and class tokens
+_RE_PACKING_GROUP_LABEL = re.compile(r'packing\s+group', re.IGNORECASE)
+_RE_DG_TABLE_HEADER = re.compile(
+    r'(?:DG\s*Class|Hazard\s*Class|Transport\s+hazard(?:\s+class(?:\(es\))?)?|Gefahrklasse|Transportklasse|Klasse\b)',
+    re.IGNORECASE)
+_RE_CLASS_ONLY_LINE = re.compile(r'^\s*class(?:\(es\))?\s*$', re.IGNORECASE)
+_RE_TRANSPORT_HAZARD = re.compile(r'Transport\s+hazard', re.IGNORECASE)
+_RE_CLASS_KEYWORD = re.compile(r'\b(Class|Klasse|Gefahrklasse)\b', re.IGNORECASE)
+_RE_DG_CONTEXT_KEYWORD = re.compile(r'(Class|Klasse|Gefahrklasse|Label|UN\b|IMDG|IATA|ADG|Hazchem|AEROSOLS)', re.IGNORECASE)
+_RE_DG_CLASS_TOKEN = re.compile(r'\b([1-9](?:\.[1-9])?)\b')
+_RE_SUBCLASS_TOKEN = re.compile(r'[1-9]\.[1-9]')
+_RE_BARE_CLASS_TOKEN = re.compile(r'[1-9]')
+# extract_section14_field: upgrade a bare DG class to a subclass seen near class/transport lines
+_RE_DG_BARE_CLASS = re.compile(r'[1-9]')
+_RE_DG_CONTEXT_LINE = re.compile(r'\b(Class|Klasse|Gefahrklasse|Label|UN\b|IMDG|IATA|ADG|Hazchem|AEROSOLS)\b', re.IGNORECASE)
+_RE_DG_SUBCLASS = re.compile(r'\b([1-9]\.[1-9])\b')
+# extract_product_name: label-adjacent values and the first-lines fallback scan
+_RE_COMPANY_SUFFIX_ONLY = re.compile(r'^(Pty\s+Ltd|Ltd|Inc\.?|Corp\.?|Company)$', re.IGNORECASE)
+_RE_PRODUCT_NAME_INLINE = re.compile(r'Product\s+Name[:\t ]*([^:\n]*)', re.IGNORECASE)
+# Case-sensitive: historically called with re.IGNORECASE in the count position
+_RE_TRAILING_COMPANY = re.compile(r'\s+(?:Pty\s+Ltd|Ltd|Inc\.?|Corp\.?).*$')
+_RE_PRODUCT_NAME_LABEL_ONLY = re.compile(r'\s*Product\s+Name\s*', re.IGNORECASE)
+_RE_NUMBERED_LINE = re.compile(r'^\d+\.')
+_RE_PRODUCT_NAME_BOILERPLATE = re.compile(r'safety\s+data\s+sheet|version|msds\s+date|page\s+\d+', re.IGNORECASE)
+# Header, label, use/registration and boilerplate lines skipped by the first-lines scan, as one search
+_RE_PRODUCT_NAME_SKIP_LINE = re.compile('|'.join(f'(?:{p})' for p in (
+    r'^\s*(?:section\s*)?1(?:\s|$)',
+    r'identification|supplier|manufacturer|emergency|contact|telephone|fax|email|web\s*site|details|address|synonym|regulation',
+    r'^use\(s\)|^use\s+of\s+the\s+substance|uses\s+advised\s+against|of\s+the\s+chemical\s+and\s+restrictions\s+on\s+use',
+    r'^registration\s+no\.?|\bregistration\s+no\.\b',
+    r'safety\s+data\s+sheet|according\s+to',
+)), re.IGNORECASE)
+_RE_PUNCT_ONLY = re.compile(r'^[:\-\s]*$')
+_RE_LEADING_NUMBER = re.compile(r'^\d+(?:\.\d+)?\s*')
+_RE_PRODUCT_IDENTIFIER_PREFIX = re.compile(r'^(?:product\s+identifier\s*[:\-]?\s*)', re.IGNORECASE)
+_RE_PRODUCT_NAME_OR_SDS_LABEL = re.compile(r'^(?:product\s+name|sds\s+no\.?|sds\s+number)', re.IGNORECASE)
+_RE_NUMBERED_DASH = re.compile(r'^\d+\s*[\-–]')
+_RE_ALNUM = re.compile(r'[A-Za-z0-9]')
+_RE_PHONE_TRIPLET = re.compile(r'\b\d{2,4}[-\s]\d{2,4}[-\s]\d{2,4}\b')
+_RE_WEB_OR_EMAIL = re.compile(r'@|www\.|\.com|\.org', re.IGNORECASE)
+# extract_manufacturer fallbacks: label lines, code-prefixed values, corporate suffixes and
+# contact clues checked on every Section 1 line
+_RE_MANUFACTURER_LABEL_NEAR = re.compile(r'(Manufacturer\s*/\s*Supplier|Hersteller\s*/\s*Lieferant|Hersteller|Lieferant)', re.IGNORECASE)
+_RE_MANUFACTURER_LABEL_ONLY = re.compile(r'(?:Manufacturer|Supplier|Hersteller|Lieferant)\s*[:\-]?', re.IGNORECASE)
+_RE_USE_OR_REGISTRY_CODE = re.compile(r'^(SU\d+|PC\d+|PROC\d+|ACN\b|ABN\b)', re.IGNORECASE)
+_COMPANY_SUFFIXES = r'Pty\s+Ltd|Ltd|Inc\.?|Corp\.?|Company|Corporation|GmbH|S\.L\.|S\.A\.|AG|BV|NV|BVBA|LLC|LLP'
+_RE_COMPANY_SUFFIX = re.compile(rf'\b(?:{_COMPANY_SUFFIXES})\b', re.IGNORECASE)
+_RE_CONTACT_CLUE = re.compile(r'(Tel\.?|Phone|Fax|E[-]?mail|E[-]?Mail|@|www\.|http|[A-Z]{1,2}-?\d{4,5}|\b[Dd]-\d{4,5}\b)')
+_RE_PRODUCT_NAME_COLON = re.compile(r'Product\s+Name\s*:', re.IGNORECASE)
+# Case-sensitive: the flag was passed as re.sub's count argument, which a fully anchored pattern ignores
+_RE_COMPANY_NAME_SPAN = re.compile(rf'^.*?([A-Z][^:\n]*(?:{_COMPANY_SUFFIXES})[^:\n]*).*$')
+_ALL_FIELD_LABELS = [label for labels in FIELD_LABELS.values() for label in labels]
+# Any known field label anywhere in a line / a line that is only a label. Labels that open with
+# '.*' only widen a fullmatch: for search() the rest of the label already matches on its own, so
+# those branches (which re-scan the line from every position) are dropped from the search union.
+_RE_ANY_FIELD_LABEL = re.compile(
+    '|'.join(f'(?:{label})' for label in _ALL_FIELD_LABELS if not label.startswith('.*')), re.IGNORECASE)
+_RE_FIELD_LABEL_LINE = re.compile(
+    '(?:' + '|'.join(f'(?:{label})' for label in _ALL_FIELD_LABELS) + r')\s*[:\-]?', re.IGNORECASE)
+
+
+def _is_header_continuation(value: str) -> bool:
+    return _RE_HEADER_CONTINUATION.fullmatch(value) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _after_label_patterns(label: str) -> Tuple[Pattern, Pattern, Pattern, Pattern, Pattern]:
+    """Compiled (same line, same line without delimiter, mid-line, duplicate-letter tolerant,
+    label only) patterns used by extract_after_label for one label."""
+    return (
+        re.compile(rf"^\W*{label}\s*[:\-]\s*(.+)$", re.IGNORECASE),
+        re.compile(rf"^\W*{label}\s+(.+)$", re.IGNORECASE),
+        re.compile(rf"{label}\s*[:\-]\s*(.+)$", re.IGNORECASE),
+        re.compile(rf"({label})\s*[:\-\s]*?(.*)$", re.IGNORECASE),
+        re.compile(label, re.IGNORECASE),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _any_label_pattern(labels: Tuple[str, ...]) -> Pattern:
+    """One alternation of ``labels``: a line it does not match cannot match any single label."""
+    return re.compile('|'.join(f'(?:{label})' for label in labels), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=16)
+def _stripped_lines(section_text: str) -> Tuple[str, ...]:
+    """Stripped lines of a section, shared by every field looked up in it."""
+    return tuple(line.strip() for line in section_text.splitlines())
+
+
+@functools.lru_cache(maxsize=4096)
+def _compressed_line(clean: str) -> tuple:
+    """Duplicate-letter normalised (text, index map) of a stripped line, for the tolerant fallback."""
+    return compress_duplicates_with_map(clean)
+
 
 def extract_after_label(section_text: str, labels: List[str], field_name: str = '') -> Optional[str]:
     """Extract value that follows a label from section text with improved validation."""
     if not section_text:
         return None
         
-    lines = section_text.splitlines()
-    
-    for i, line in enumerate(lines):
-        clean = line.strip()
+    lines = _stripped_lines(section_text)
+    label_patterns = [_after_label_patterns(label) for label in labels]
+    any_label_re = _any_label_pattern(tuple(labels))
+    tolerant_field = field_name in ('description', 'product_use')
+
+    for i, clean in enumerate(lines):
         if not clean:
             continue
 
-        for label in labels:
-            logger.debug(f"[SDS_EXTRACTOR] Checking label '{label}' in line: '{clean[:50]}...'")
+        # Duplicate-letter normalised line, computed at most once per line (not once per label)
+        compressed = None
+
+        # Every case below needs one of the labels somewhere in the line (or, for the tolerant
+        # fields, in its duplicate-letter normalised form), so skip other lines with one search
+        if not any_label_re.search(clean):
+            if not tolerant_field:
+                continue
+            compressed = _compressed_line(clean)
+            if not any_label_re.search(compressed[0]):
+                continue
+
+        for label, (same_line_re, spaced_re, mid_line_re, tolerant, label_only_re) in zip(labels, label_patterns):
+            logger.debug("[SDS_EXTRACTOR] Checking label '%s' in line: '%s...'", label, clean[:50])
             
             # Case 1: label and value on same line
             # Allow leading bullets or symbols before the label
-            same_line_pattern = rf"^\W*{label}\s*[:\-]\s*(.+)$"
-            same = re.search(same_line_pattern, clean, re.IGNORECASE)
+            same = same_line_re.search(clean)
             if not same:
                 # Handle case with whitespace but no colon/hyphen, but avoid matching section headers like
                 # "Manufacturer or supplier's details" or "Recommended use of the chemical and restrictions on use".
                 # Use a generic whitespace matcher after the label (no word-boundary), so labels ending with
                 # non-word characters (e.g., "Use(s)") are supported.
-                tmp = re.search(rf"^\W*{label}\s+(.+)$", clean, re.IGNORECASE)
+                tmp = spaced_re.search(clean)
                 if tmp:
                     tail = tmp.group(1).strip()
                     # Common continuation phrases that indicate this is still part of the label header, not a value
-                    continuation_noise = [
-                        r"^of\s+the\s+chemical\s+and\s+restrictions\s+on\s+use$",
-                        r"^of\s+the\s+safety\s+data\s+sheet$",
-                        r"^or\s+supplier'?s\s+details$",
-                        r"^of\s+the\s+company/undertaking$",
-                    ]
-                    if any(re.fullmatch(p, tail, re.IGNORECASE) for p in continuation_noise):
+                    if _is_header_continuation(tail):
                         same = None
                     else:
                         same = tmp
@@ -61,18 +215,18 @@ def extract_after_label(section_text: str, labels: List[str], field_name: str =
             # Fallback: handle labels that appear mid-line (e.g., after another field)
             # Example: "Address: ... Product Use: Lubricant, ..."
             if not same:
-                mid_line_pattern = rf"{label}\s*[:\-]\s*(.+)$"
-                mid = re.search(mid_line_pattern, clean, re.IGNORECASE)
+                mid = mid_line_re.search(clean)
                 if mid:
                     same = mid
 
             # Final fallback: duplicate-letter tolerant label match (no delimiter required)
             if not same and field_name in ('description', 'product_use'):
                 try:
-                    norm_line, idx_map = compress_duplicates_with_map(clean)
-                    tolerant = re.compile(rf"({label})\s*[:\-\s]*?(.*)$", re.IGNORECASE)
+                    if compressed is None:
+                        compressed = _compressed_line(clean)
+                    norm_line, idx_map = compressed
                     # Prefer start-of-line, then fallback to anywhere on the line
-                    m = re.match(tolerant, norm_line)
+                    m = tolerant.match(norm_line)
                     if not m:
                         m = tolerant.search(norm_line)
                     if m and m.group(2) is not None:
@@ -80,7 +234,7 @@ def extract_after_label(section_text: str, labels: List[str], field_name: str =
                         start_orig = idx_map[end_norm - 1] + 1 if 0 < end_norm <= len(idx_map) else 0
                         tail_orig = clean[start_orig:].lstrip(" :\t-.")
                         if tail_orig:
-                            same = re.match(r"^(.+)$", tail_orig)
+                            same = _RE_WHOLE_VALUE.match(tail_orig)
                 except re.error:
                     pass
             search_next = False
@@ -88,68 +242,54 @@ def extract_after_label(section_text: str, labels: List[str], field_name: str =
                 value = same.group(1).strip()
 
                 # Remove leading possessive artifacts like "'s" or "'s"
-                value = re.sub(r"^[\"''`]+s\b\s*", "", value)
+                value = _RE_POSSESSIVE_PREFIX.sub("", value)
 
                 # Normalize common label continuation fragments that trail after generic labels like 'Use'
                 # Example: "Use : of the Substance/Mixture : Washing and cleaning products ..."
-                value = re.sub(
-                    r'^(?:of\s+the\s+(?:substance|chemical)(?:\s*/\s*mixture|\s+or\s+mixture)?)(?:\s+and\s+uses\s+advised\s+against)?\s*[:\-]*\s*',
-                    '', value, flags=re.IGNORECASE)
+                value = _RE_USE_LABEL_CONTINUATION.sub('', value)
                 
                 # Special cleaning for common noise patterns that were causing issues
-                value = re.sub(r"^of\s+the\s+safety\s+data\s+sheet\s*", "", value, re.IGNORECASE)
-                value = re.sub(r"^of\s+the\s+substance\s+or\s+mixture\s+and\s+uses\s+advised\s+against\s*", "", value, re.IGNORECASE)
+                value = _RE_OF_THE_SDS_PREFIX.sub("", value)
+                value = _RE_OF_THE_SUBSTANCE_PREFIX.sub("", value)
 
                 # Skip if the value clearly refers to a product code or similar non-name data
-                if re.search(r"product\s+code", value, re.IGNORECASE):
-                    logger.debug(f"[SDS_EXTRACTOR] Skipping value containing product code: '{value}'")
+                if _RE_PRODUCT_CODE.search(value):
+                    logger.debug("[SDS_EXTRACTOR] Skipping value containing product code: '%s'", value)
                     continue
 
-                logger.debug(f"[SDS_EXTRACTOR] Found same-line match: '{value}'")
+                logger.debug("[SDS_EXTRACTOR] Found same-line match: '%s'", value)
 
                 # Clean up the value - remove trailing noise
                 # Split on common separators that indicate end of value or start of another label on same line
-                for separator in [
-                    r'\s+Tel:', r'\s+Phone:', r'\s+Fax:', r'\s+Email:', r'\s+Website:',
-                    r'\s+Emergency:', r'\s+Address:', r'\s+Contact:', r'\s+Product\s+code:',
-                    # Guard: if another label starts on same line, trim at that point
-                    r'\s+Intended\s+use\b', r'\s+Identified\s+uses\b', r'\s+Uses\s+advised\s+against\b',
-                    r'\s+Use\s+of\s+the\s+substance\b', r'\s+Restrictions\s+on\s+use\b'
-                ]:
-                    split_match = re.split(separator, value, flags=re.IGNORECASE)
-                    if len(split_match) > 1:
-                        value = split_match[0].strip()
+                for separator in _VALUE_SEPARATORS:
+                    split_match = separator.search(value)
+                    if split_match:
+                        value = value[:split_match.start()].strip()
                         break
 
                 # Remove common trailing noise patterns
-                value = re.sub(r'\s*[:\-]\s*$', '', value)  # Remove trailing colons/dashes
-                value = re.sub(r'\s+Page\s+\d+.*$', '', value, flags=re.IGNORECASE)  # Remove page numbers
+                value = _RE_TRAILING_SEPARATOR.sub('', value)  # Remove trailing colons/dashes
+                value = _RE_PAGE_NUMBER_TAIL.sub('', value)  # Remove page numbers
 
                 # If value is actually a continuation of the label header, skip and search next lines
-                header_continuations = [
-                    r"^of\s+the\s+chemical\s+and\s+restrictions\s+on\s+use$",
-                    r"^of\s+the\s+safety\s+data\s+sheet$",
-                    r"^or\s+supplier'?s\s+details$",
-                    r"^of\s+the\s+company/undertaking$",
-                ]
-                if any(re.fullmatch(p, value, re.IGNORECASE) for p in header_continuations):
-                    logger.debug(f"[SDS_EXTRACTOR] Skipping header continuation value: '{value}'")
+                if _is_header_continuation(value):
+                    logger.debug("[SDS_EXTRACTOR] Skipping header continuation value: '%s'", value)
                     search_next = True
                     value = ''
 
                 if value and not is_noise_text(value):
-                    logger.debug(f"[SDS_EXTRACTOR] Accepting value: '{value}'")
+                    logger.debug("[SDS_EXTRACTOR] Accepting value: '%s'", value)
                     return value
                 else:
-                    logger.debug(f"[SDS_EXTRACTOR] Rejecting value as noise: '{value}'")
+                    logger.debug("[SDS_EXTRACTOR] Rejecting value as noise: '%s'", value)
                     search_next = True
 
             # Case 2: label alone on this line or previous value rejected as noise, look for value on subsequent lines
-            if search_next or re.fullmatch(label, clean, re.IGNORECASE):
-                logger.debug(f"[SDS_EXTRACTOR] Looking for value on next lines")
+            if search_next or label_only_re.fullmatch(clean):
+                logger.debug("[SDS_EXTRACTOR] Looking for value on next lines")
                 j = i + 1
                 while j < len(lines) and j < i + 5:  # Limit search to next 5 lines
-                    candidate_line = lines[j].strip()
+                    candidate_line = lines[j]
                     if not candidate_line:
                         j += 1
                         continue
@@ -160,51 +300,62 @@ def extract_after_label(section_text: str, labels: List[str], field_name: str =
                         candidate = candidate[1:].strip()
 
                     # Stop if we hit another label
-                    if any(re.search(lab, candidate, re.IGNORECASE) for lab in [l for labs in FIELD_LABELS.values() for l in labs]):
+                    if _RE_ANY_FIELD_LABEL.search(candidate):
                         break
 
                     # Avoid registration numbers being treated as product name values
-                    if field_name == 'product_name' and re.match(r'^registration\s+no\.?', candidate, re.IGNORECASE):
+                    if field_name == 'product_name' and _RE_REGISTRATION_NO.match(candidate):
                         j += 1
                         continue
 
                     # Skip if candidate is a known header continuation fragment
-                    if any(re.fullmatch(p, candidate, re.IGNORECASE) for p in [
-                        r"^of\s+the\s+chemical\s+and\s+restrictions\s+on\s+use$",
-                        r"^of\s+the\s+safety\s+data\s+sheet$",
-                        r"^or\s+supplier'?s\s+details$",
-                        r"^of\s+the\s+company/undertaking$",
-                    ]):
+                    if _is_header_continuation(candidate):
                         j += 1
                         continue
 
                     # Skip if the candidate is actually a section header
-                    if field_name == 'product_name' and re.match(r'^\s*(?:section\s*)?\d', candidate, re.IGNORECASE):
+                    if field_name == 'product_name' and _RE_SECTION_HEADER_START.match(candidate):
                         j += 1
                         continue
 
                     if candidate and not is_noise_text(candidate):
-                        logger.debug(f"[SDS_EXTRACTOR] Found value on next line: '{candidate}'")
+                        logger.debug("[SDS_EXTRACTOR] Found value on next line: '%s'", candidate)
                         return candidate
                     j += 1
 
     return None
 
 
+def _first_class_tokens(line: str) -> Tuple[Optional[str], Optional[str]]:
+    """First DG subclass token (e.g. '2.1') and first bare class token (e.g. '3') in a table line."""
+    subclass = None
+    bareclass = None
+    for tok in line.replace('|', ' ').split():
+        t = tok.strip(',;')
+        if subclass is None and _RE_SUBCLASS_TOKEN.fullmatch(t):
+            subclass = t
+        elif bareclass is None and _RE_BARE_CLASS_TOKEN.fullmatch(t):
+            bareclass = t
+    return subclass, bareclass
+
+
 def extract_from_table_structure(text: str, field_name: str) -> Optional[str]:
     """Extract values from tabular layouts where standard label matching fails."""
     if not text:
         return None
+    # One search rules out packing group tables in sections that never mention the label
+    if field_name == 'packing_group' and not _RE_PACKING_GROUP_LABEL.search(text):
+        return None
     
-    lines = text.splitlines()
+    lines = _stripped_lines(text)
     
     # Strategy for packing group in tables
     if field_name == 'packing_group':
         # Look for table rows with "Packing Group" header
         for i, line in enumerate(lines):
-            if re.search(r'packing\s+group', line, re.IGNORECASE):
+            if _RE_PACKING_GROUP_LABEL.search(line):
                 # Check same line for value after the header
-                parts = re.split(r'\s{2,}|\t|\|', line)  # Split on multiple spaces, tabs, or pipes
+                parts = _RE_TABLE_CELL_SPLIT.split(line)  # Split on multiple spaces, tabs, or pipes
                 if len(parts) > 1:
                     for part in parts[1:]:  # Skip the header part
                         part = part.strip()
@@ -214,12 +365,12 @@ def extract_from_table_structure(text: str, field_name: str) -> Optional[str]:
                 
                 # Check next few lines for table data
                 for j in range(i + 1, min(i + 4, len(lines))):
-                    table_line = lines[j].strip()
+                    table_line = lines[j]
                     if not table_line:
                         continue
                     
                     # Split table row into cells
-                    cells = re.split(r'\s{2,}|\t|\|', table_line)
+                    cells = _RE_TABLE_CELL_SPLIT.split(table_line)
                     for cell in cells:
                         cell = cell.strip()
                         if cell and VALID_PACKING_GROUPS.match(cell):
@@ -228,33 +379,21 @@ def extract_from_table_structure(text: str, field_name: str) -> Optional[str]:
     
     # Strategy for dangerous goods class in tables  
     elif field_name == 'dangerous_goods_class':
+        # Tokenise every line once; the header and keyword windows below only look these up
+        line_classes = [_first_class_tokens(line) for line in lines]
         for i, line in enumerate(lines):
             # Allow header to be split across lines (e.g., 'Transport hazard' then 'class(es)')
-            header_hit = re.search(r'(?:DG\s*Class|Hazard\s*Class|Transport\s+hazard(?:\s+class(?:\(es\))?)?|Gefahrklasse|Transportklasse|Klasse\b)', line, re.IGNORECASE)
+            header_hit = _RE_DG_TABLE_HEADER.search(line)
             if not header_hit:
                 # If current line is just 'class(es)', also accept when previous had 'Transport hazard'
-                if i > 0 and re.search(r'^\s*class(?:\(es\))?\s*$', line, re.IGNORECASE) and re.search(r'Transport\s+hazard', lines[i-1], re.IGNORECASE):
+                if i > 0 and _RE_CLASS_ONLY_LINE.search(line) and _RE_TRANSPORT_HAZARD.search(lines[i-1]):
                     header_hit = True
             if header_hit:
-                # Gather this line and the next couple lines to scan for class tokens
-                segment = [line]
-                for j in range(i + 1, min(i + 25, len(lines))):
-                    nxt = lines[j].strip()
-                    if nxt:
-                        segment.append(nxt)
-                # Check tokens across the segment
-                # Prefer subclass tokens (e.g., 2.1) over bare classes (e.g., 2)
-                subclass = None
-                bareclass = None
-                for seg_line in segment:
-                    tokens = re.split(r'\s+|\|', seg_line)
-                    for tok in tokens:
-                        t = tok.strip(',;')
-                        if validate_dangerous_goods_class(t):
-                            if re.match(r'^[1-9]\.[1-9]$', t):
-                                subclass = subclass or t
-                            elif re.match(r'^[1-9]$', t):
-                                bareclass = bareclass or t
+                # Scan this line and the next 24 for class tokens, preferring subclass
+                # tokens (e.g., 2.1) over bare classes (e.g., 2)
+                segment = line_classes[i:i + 25]
+                subclass = next((sub for sub, _ in segment if sub), None)
+                bareclass = next((bare for _, bare in segment if bare), None)
                 if subclass:
                     logger.info(f"[SDS_EXTRACTOR] Found DG subclass in table segment: '{subclass}'")
                     return subclass
@@ -263,25 +402,23 @@ def extract_from_table_structure(text: str, field_name: str) -> Optional[str]:
                     return bareclass
         # Final fallback: scan lines that contain Class/Klasse keywords for a valid class token
         for i, line in enumerate(lines):
-            if re.search(r'\b(Class|Klasse|Gefahrklasse)\b', line, re.IGNORECASE):
-                window = " ".join(lines[i:i+20])
-                toks = [t.strip(',;') for t in re.split(r'\s+|\|', window) if t.strip()]
+            if _RE_CLASS_KEYWORD.search(line):
+                window = line_classes[i:i + 20]
                 # Prefer subclass tokens
-                for t in toks:
-                    if re.match(r'^[1-9]\.[1-9]$', t):
-                        logger.info(f"[SDS_EXTRACTOR] Found DG subclass near keyword: '{t}'")
-                        return t
-                for t in toks:
-                    if re.match(r'^[1-9]$', t):
-                        logger.info(f"[SDS_EXTRACTOR] Found DG class near keyword: '{t}'")
-                        return t
+                t = next((sub for sub, _ in window if sub), None)
+                if t:
+                    logger.info(f"[SDS_EXTRACTOR] Found DG subclass near keyword: '{t}'")
+                    return t
+                t = next((bare for _, bare in window if bare), None)
+                if t:
+                    logger.info(f"[SDS_EXTRACTOR] Found DG class near keyword: '{t}'")
+                    return t
         # Global scan across section with context keywords; prefer subclass and most frequent
-        ctx_pat = re.compile(r'(Class|Klasse|Gefahrklasse|Label|UN\b|IMDG|IATA|ADG|Hazchem|AEROSOLS)', re.IGNORECASE)
         counts = {}
         for line in lines:
-            if not ctx_pat.search(line):
+            if not _RE_DG_CONTEXT_KEYWORD.search(line):
                 continue
-            for tok in re.findall(r'\b([1-9](?:\.[1-9])?)\b', line):
+            for tok in _RE_DG_CLASS_TOKEN.findall(line):
                 counts[tok] = counts.get(tok, 0) + 1
         if counts:
             # Prefer subclass tokens
@@ -308,33 +445,33 @@ def extract_product_name(section_text: str) -> Optional[str]:
         product_name = strip_doubled_label_prefix(product_name)
     if product_name and not is_noise_text(product_name) and not looks_like_numeric_code(product_name):
         # Additional validation - reject if it looks like a company suffix
-        if not re.match(r'^(Pty\s+Ltd|Ltd|Inc\.?|Corp\.?|Company)$', product_name, re.IGNORECASE):
+        if not _RE_COMPANY_SUFFIX_ONLY.match(product_name):
             logger.info(f"[SDS_EXTRACTOR] Product name from label: '{product_name}'")
             return product_name
     
     # Strategy 2: Look for split-table format (addressing sds_5.pdf issue)
     # Pattern: "Product Name: WD-40 Aerosol" might be split across cells
     # Only allow spaces/tabs after label; do not cross newlines
-    product_name_match = re.search(r'Product\s+Name[:\t ]*([^:\n]*)', section_text, re.IGNORECASE)
+    product_name_match = _RE_PRODUCT_NAME_INLINE.search(section_text)
     if product_name_match:
         candidate = product_name_match.group(1).strip()
         # Clean up noise like trailing company info
-        candidate = re.sub(r'\s+(?:Pty\s+Ltd|Ltd|Inc\.?|Corp\.?).*$', '', candidate, re.IGNORECASE)
+        candidate = _RE_TRAILING_COMPANY.sub('', candidate)
         candidate = strip_doubled_label_prefix(candidate)
         if candidate and not is_noise_text(candidate) and len(candidate) > 2 and not looks_like_numeric_code(candidate):
             logger.info(f"[SDS_EXTRACTOR] Product name from split table: '{candidate}'")
             return candidate
     
     # Strategy 2b: If a bare "Product Name" label appears, use the previous non-empty line
-    lines = section_text.splitlines()
+    lines = _stripped_lines(section_text)
     for idx, line in enumerate(lines):
-        if re.fullmatch(r'\s*Product\s+Name\s*', line, re.IGNORECASE):
+        if _RE_PRODUCT_NAME_LABEL_ONLY.fullmatch(line):
             j = idx - 1
             while j >= 0:
-                prev = lines[j].strip()
+                prev = lines[j]
                 if prev:
                     # Avoid section headers and boilerplate
-                    if not re.match(r'^\d+\.', prev) and not re.search(r'safety\s+data\s+sheet|version|msds\s+date|page\s+\d+', prev, re.IGNORECASE):
+                    if not _RE_NUMBERED_LINE.match(prev) and not _RE_PRODUCT_NAME_BOILERPLATE.search(prev):
                         prev = strip_doubled_label_prefix(prev)
                         if not is_noise_text(prev) and not looks_like_numeric_code(prev):
                             logger.info(f"[SDS_EXTRACTOR] Product name from line above label: '{prev}'")
@@ -345,59 +482,40 @@ def extract_product_name(section_text: str) -> Optional[str]:
     # Strategy 3: Look for product name in the first few meaningful lines
     meaningful_lines = []
     
-    for line in lines[:15]:  # Check first 15 lines only
-        clean = line.strip()
+    for clean in lines[:15]:  # Check first 15 lines only
         if not clean:
             continue
         
-        # Skip obvious header/label lines
-        if re.match(r'^\s*(?:section\s*)?1(?:\s|$)', clean, re.IGNORECASE):
-            continue
-        if re.search(r'identification|supplier|manufacturer|emergency|contact|telephone|fax|email|web\s*site|details|address|synonym|regulation', clean, re.IGNORECASE):
-            continue
-        # Skip common Section 1 label continuations and use headers
-        if re.search(r"^use\(s\)|^use\s+of\s+the\s+substance|uses\s+advised\s+against|of\s+the\s+chemical\s+and\s+restrictions\s+on\s+use", clean, re.IGNORECASE):
-            continue
-        # Skip registration identifiers often near headers
-        if re.search(r"^registration\s+no\.?|\bregistration\s+no\.\b", clean, re.IGNORECASE):
-            continue
-        if clean.startswith('(') or re.search(r'safety\s+data\s+sheet|according\s+to', clean, re.IGNORECASE):
+        # Skip obvious header/label lines, Section 1 label continuations and use headers,
+        # registration identifiers and SDS boilerplate
+        if clean.startswith('(') or _RE_PRODUCT_NAME_SKIP_LINE.search(clean):
             continue
         if is_noise_text(clean):
             continue
-        if re.match(r'^[:\-\s]*$', clean):
+        if _RE_PUNCT_ONLY.match(clean):
             continue
 
         # Skip lines that are clearly labels (optionally followed by punctuation)
-        is_label = False
-        for label_group in FIELD_LABELS.values():
-            for label in label_group:
-                if re.fullmatch(rf"{label}\s*[:\-]?", clean, re.IGNORECASE):
-                    is_label = True
-                    break
-            if is_label:
-                break
-
-        if not is_label:
+        if not _RE_FIELD_LABEL_LINE.fullmatch(clean):
             meaningful_lines.append(clean)
     
     # Take the first meaningful line that looks like a product name
     for line in meaningful_lines:
-        candidate = re.sub(r'^\d+(?:\.\d+)?\s*', '', line)
-        candidate = re.sub(r'^(?:product\s+identifier\s*[:\-]?\s*)', '', candidate, flags=re.IGNORECASE)
+        candidate = _RE_LEADING_NUMBER.sub('', line)
+        candidate = _RE_PRODUCT_IDENTIFIER_PREFIX.sub('', candidate)
 
-        if re.search(r'^(?:product\s+name|sds\s+no\.?|sds\s+number)', candidate, re.IGNORECASE):
+        if _RE_PRODUCT_NAME_OR_SDS_LABEL.search(candidate):
             continue
-        if re.match(r'^\d+\s*[\-–]', candidate):
+        if _RE_NUMBERED_DASH.match(candidate):
             continue
 
         # Remove any doubled-letter label prefix that leaked into the line
         candidate = strip_doubled_label_prefix(candidate)
-        if re.search(r'[A-Za-z0-9]', candidate) and len(candidate) > 3 and not looks_like_numeric_code(candidate):
-            if not re.search(r'\b\d{2,4}[-\s]\d{2,4}[-\s]\d{2,4}\b', candidate):
-                if not re.search(r'@|www\.|\.com|\.org', candidate, re.IGNORECASE):
+        if _RE_ALNUM.search(candidate) and len(candidate) > 3 and not looks_like_numeric_code(candidate):
+            if not _RE_PHONE_TRIPLET.search(candidate):
+                if not _RE_WEB_OR_EMAIL.search(candidate):
                     # Additional check to reject company suffixes
-                    if not re.match(r'^(Pty\s+Ltd|Ltd|Inc\.?|Corp\.?|Company)$', candidate, re.IGNORECASE):
+                    if not _RE_COMPANY_SUFFIX_ONLY.match(candidate):
                         logger.info(f"[SDS_EXTRACTOR] Product name from meaningful line: '{candidate}'")
                         return candidate
     
@@ -432,27 +550,27 @@ def extract_manufacturer(section_text: str) -> Optional[str]:
     
     # Strategy 1c: Nearby lines around manufacturer/supplier labels (handles layouts where value is separated)
     try:
-        lines = section_text.splitlines()
+        lines = _stripped_lines(section_text)
         for i, line in enumerate(lines):
-            if re.search(r'(Manufacturer\s*/\s*Supplier|Hersteller\s*/\s*Lieferant|Hersteller|Lieferant)', line, re.IGNORECASE):
+            if _RE_MANUFACTURER_LABEL_NEAR.search(line):
                 # Only scan forward lines to avoid picking earlier classification codes (e.g., PROC7)
                 for j in range(i + 1, min(len(lines), i + 8)):
-                    cand = lines[j].strip()
+                    cand = lines[j]
                     if not cand or is_noise_text(cand):
                         continue
                     # Skip pure labels and known code prefixes
-                    if re.fullmatch(r'(?:Manufacturer|Supplier|Hersteller|Lieferant)\s*[:\-]?', cand, re.IGNORECASE):
+                    if _RE_MANUFACTURER_LABEL_ONLY.fullmatch(cand):
                         continue
-                    if re.match(r'^(SU\d+|PC\d+|PROC\d+|ACN\b|ABN\b)', cand, re.IGNORECASE):
+                    if _RE_USE_OR_REGISTRY_CODE.match(cand):
                         continue
                     cleaned = clean_company_candidate(cand)
                     if not cleaned or is_noise_text(cleaned):
                         continue
                     # Prefer classic corporate suffixes; otherwise, require contact/address clue nearby
-                    has_suffix = re.search(r'\b(Pty\s+Ltd|Ltd|Inc\.?|Corp\.?|Company|Corporation|GmbH|S\.L\.|S\.A\.|AG|BV|NV|BVBA|LLC|LLP)\b', cleaned, re.IGNORECASE)
+                    has_suffix = _RE_COMPANY_SUFFIX.search(cleaned)
                     if not has_suffix:
                         window = "\n".join(lines[j:j+5])
-                        if not re.search(r'(Tel\.?|Phone|Fax|E[-]?mail|E[-]?Mail|@|www\.|http|[A-Z]{1,2}-?\d{4,5}|\b[Dd]-\d{4,5}\b)', window):
+                        if not _RE_CONTACT_CLUE.search(window):
                             continue
                     logger.info(f"[SDS_EXTRACTOR] Manufacturer near label: '{cleaned}'")
                     return cleaned
@@ -468,7 +586,7 @@ def extract_manufacturer(section_text: str) -> Optional[str]:
         for line in supplier_text.splitlines():
             clean = line.strip()
             if clean and not is_noise_text(clean) and len(clean) > 3:
-                if not re.search(r'\b\d{2,4}[-\s]\d{2,4}[-\s]\d{2,4}\b', clean):  # Not phone
+                if not _RE_PHONE_TRIPLET.search(clean):  # Not phone
                     cleaned = clean_company_candidate(clean)
                     if cleaned and not is_noise_text(cleaned):
                         logger.info(f"[SDS_EXTRACTOR] Manufacturer from supplier details: '{cleaned}'")
@@ -476,19 +594,16 @@ def extract_manufacturer(section_text: str) -> Optional[str]:
     
     # Strategy 3: Look for company names that appear before product names
     # This helps with cases where layout is: "Company Name" followed by "Product Name: actual product"
-    lines = section_text.splitlines()
-    for i, line in enumerate(lines):
-        clean = line.strip()
+    for clean in _stripped_lines(section_text):
         if not clean:
             continue
         
         # Look for lines that contain company indicators
-        if re.search(r'\b(?:Pty\s+Ltd|Ltd|Inc\.?|Corp\.?|Company|Corporation|GmbH|S\.L\.|S\.A\.|AG|BV|NV|BVBA|LLC|LLP)\b', clean, re.IGNORECASE):
+        if _RE_COMPANY_SUFFIX.search(clean):
             # Check if this looks like a company name (not just "Product Name: Pty Ltd")
-            if not re.search(r'Product\s+Name\s*:', clean, re.IGNORECASE):
+            if not _RE_PRODUCT_NAME_COLON.search(clean):
                 # Clean up the company name
-                company_name = re.sub(r'^.*?([A-Z][^:\n]*(?:Pty\s+Ltd|Ltd|Inc\.?|Corp\.?|Company|Corporation|GmbH|S\.L\.|S\.A\.|AG|BV|NV|BVBA|LLC|LLP)[^:\n]*).*$', 
-                                    r'\1', clean, re.IGNORECASE)
+                company_name = _RE_COMPANY_NAME_SPAN.sub(r'\1', clean)
                 if company_name != clean and company_name:  # If regex matched and extracted something
                     company_name = clean_company_candidate(company_name.strip())
                     if company_name and not is_noise_text(company_name):
@@ -586,43 +701,22 @@ def extract_date_from_header(text: str) -> Optional[str]:
             continue
         
         # Look for revision date patterns in headers
-        revision_patterns = [
-            # Generic Revision / Rev / Date labels
-            r'Revision(?:\s*Date)?[:\s]+(\d{4}-\d{2}-\d{2})',
-            r'Revision(?:\s*Date)?[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Revision(?:\s*Date)?[:\s]+(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})',
-            r'Rev[:\s]+(\d{4}-\d{2}-\d{2})',
-            r'Rev[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Rev[:\s]+(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})',
-            r'Date[:\s]+(\d{4}-\d{2}-\d{2})',
-            r'Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Date[:\s]+(\d{1,2}\s+[A-Za-z]{3,}\.?\s+\d{2,4})',
-            # Header/footer variants
-            r'Printing\s+date[:\s]+(\d{1,2}\s+[A-Za-z]{3,}\.?\s+\d{4})',
-            r'Printed\s+on[:\s]+(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})',
-        ]
-        
-        for pattern in revision_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in _HEADER_DATE_PATTERNS:
+            match = pattern.search(line)
             if match:
                 date_str = match.group(1)
                 # Normalize month abbreviations with trailing period (e.g., "Jan.")
-                date_str = re.sub(r'\b([A-Za-z]{3,})\.', r'\1', date_str)
-                try:
-                    from datetime import datetime, date
-                    # Try to parse and validate
-                    for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%d %b %Y', '%d %B %Y', '%d-%b-%Y', '%d-%b-%y', '%d.%b.%Y', '%d.%b.%y']:
-                        try:
-                            parsed_date = datetime.strptime(date_str, fmt).date()
-                            if parsed_date <= date.today():  # Must be in the past
-                                formatted_date = parsed_date.strftime('%Y-%m-%d')
-                                logger.info(f"[SDS_EXTRACTOR] Date from header: '{formatted_date}'")
-                                return formatted_date
-                        except ValueError:
-                            continue
-                except ImportError:
-                    # If datetime not available, return as-is
-                    return date_str
+                date_str = _RE_MONTH_ABBREV_DOT.sub(r'\1', date_str)
+                # Try to parse and validate
+                for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%d-%m-%Y', '%d %b %Y', '%d %B %Y', '%d-%b-%Y', '%d-%b-%y', '%d.%b.%Y', '%d.%b.%y']:
+                    try:
+                        parsed_date = datetime.strptime(date_str, fmt).date()
+                        if parsed_date <= date.today():  # Must be in the past
+                            formatted_date = parsed_date.strftime('%Y-%m-%d')
+                            logger.info(f"[SDS_EXTRACTOR] Date from header: '{formatted_date}'")
+                            return formatted_date
+                    except ValueError:
+                        continue
     
     return None
 
@@ -650,16 +744,20 @@ def extract_section14_field(sec14: str, labels: List[str], field_name: str) -> O
     # If label extraction failed, try table extraction
     table_result = extract_from_table_structure(sec14, field_name)
     if table_result:
-        if field_name == 'dangerous_goods_class' and re.fullmatch(r'[1-9]', table_result):
+        if field_name == 'dangerous_goods_class' and _RE_DG_BARE_CLASS.fullmatch(table_result):
             # Try to find a more specific subclass (e.g., 2.1) in context
             lines = sec14.splitlines()
+            # Subclass tokens per line, found once; each context line's 20-line window sums them
+            # (a match cannot span the joined lines, so this equals scanning the joined window)
+            line_subclasses = [_RE_DG_SUBCLASS.findall(line) for line in lines]
             toks = []
             for i, line in enumerate(lines):
-                if re.search(r'\b(Class|Klasse|Gefahrklasse|Label|UN\b|IMDG|IATA|ADG|Hazchem|AEROSOLS)\b', line, re.IGNORECASE):
-                    window = ' '.join(lines[i:i+20])
-                    toks += re.findall(r'\b([1-9]\.[1-9])\b', window)
+                if _RE_DG_CONTEXT_LINE.search(line):
+                    for subclasses in line_subclasses[i:i + 20]:
+                        toks += subclasses
             if toks:
-                choice = max(((toks.count(t), t) for t in set(toks)), key=lambda x: x[0])[1]
+                tok_counts = Counter(toks)
+                choice = max(((tok_counts[t], t) for t in set(toks)), key=lambda x: x[0])[1]
                 logger.info(f"[SDS_EXTRACTOR] Upgrading DG class from '{table_result}' to subclass '{choice}' via context")
                 return choice
         return table_result
@@ -14,10 +14,11 @@ HEADER_CONTINUATIONS = [
     r"^or\s+supplier'?s\s+details$",
     r"^of\s+the\s+company/undertaking$",
 ]
+_RE_HEADER_CONTINUATION = re.compile('|'.join(f'(?:{p})' for p in HEADER_CONTINUATIONS), re.IGNORECASE)
 
 
 def _is_header_continuation(text: str) -> bool:
-    return any(re.fullmatch(p, text.strip(), re.IGNORECASE) for p in HEADER_CONTINUATIONS)
+    return _RE_HEADER_CONTINUATION.fullmatch(text.strip()) is not None
 
 
 def product_name(section1_text: str) -> Optional[str]:
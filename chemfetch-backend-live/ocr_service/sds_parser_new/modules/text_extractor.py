@@ -1,46 +1,260 @@
 """
 PDF text extraction module
 """
-import io
 import logging
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from PIL import Image
 
 from .dependencies import (
-    PYMUPDF_AVAILABLE, PDFPLUMBER_AVAILABLE, PDFMINER_AVAILABLE,
-    OCR_AVAILABLE, PDF2IMAGE_AVAILABLE,
-    pytesseract, convert_from_path, pdfminer_extract, fitz, pdfplumber
+    PYMUPDF_AVAILABLE, PYPDFIUM2_AVAILABLE, PDFPLUMBER_AVAILABLE, PDFMINER_AVAILABLE,
+    OCR_AVAILABLE, TESSEROCR_AVAILABLE, PDF2IMAGE_AVAILABLE,
+    pytesseract, tesserocr, convert_from_path, pdfminer_extract, fitz, pdfium, pdfplumber,
+    tesserocr_ocr, tesserocr_ready,
 )
-from .config import MIN_TEXT_LENGTH
+from .config import (
+    MIN_TEXT_LENGTH, SUFFICIENT_TEXT_LENGTH, SUFFICIENT_TEXT_PER_PAGE, OCR_MAX_PAGES, OCR_DPI, OCR_BINARIZE,
+    OCR_TESSERACT_CONFIG,
+    OCR_RUN_PAGES, OCR_WORKERS, OCR_BATCH_MIN_PAGES,
+    TEXT_DENSITY_THRESHOLD, TEXT_DENSITY_SAMPLE_PAGES
+)
+from .utils import build_section_index
 
 logger = logging.getLogger(__name__)
 
 
+# A line that could open section 14; until one appears the section index is not worth building
+_RE_SECTION_14_START = re.compile(r'^\s*(?:section\s*)?14\b', re.IGNORECASE | re.MULTILINE)
+
+
+def _sections_located(text: str, needed: Tuple[int, ...] = (1, 14)) -> bool:
+    """True once ``text`` holds every needed section and the header that closes it."""
+    index = build_section_index(text)
+    for number in needed:
+        bounds = index.get(number)
+        if not bounds or bounds[1] == len(text):
+            return False
+    return True
+
+
+def _is_image_page(page, page_text: str) -> bool:
+    """True if a PyMuPDF page carries an image and too little text for its area to be a text page."""
+    area = max(1.0, page.rect.width * page.rect.height)
+    return len(page_text.strip()) / area < TEXT_DENSITY_THRESHOLD and bool(page.get_images())
+
+
+def _classify(image_pages: List[bool]) -> str:
+    """Route a document from its per-page image flags (in extraction order).
+
+    ``"scanned"`` if every one of the first TEXT_DENSITY_SAMPLE_PAGES pages is an image,
+    ``"mixed"`` if only some extracted pages are, ``"text"`` otherwise.
+    """
+    sample = image_pages[:TEXT_DENSITY_SAMPLE_PAGES]
+    if sample and all(sample):
+        return "scanned"
+    return "mixed" if any(image_pages) else "text"
+
+
+def _render_page(doc, index: int) -> Image.Image:
+    """Rasterise one PyMuPDF page to a grayscale image for OCR."""
+    # Tesseract binarises internally; a single gray channel is all it needs
+    pix = doc[index].get_pixmap(dpi=OCR_DPI, colorspace=fitz.csGRAY, alpha=False)
+    return Image.frombytes("L", (pix.width, pix.height), pix.samples)
+
+
+def _otsu_threshold(histogram: List[int]) -> int:
+    """Gray level that maximises the between-class variance of a 256-bin histogram (Otsu)."""
+    total = sum(histogram)
+    sum_all = sum(i * h for i, h in enumerate(histogram))
+    weight_bg = 0
+    sum_bg = 0
+    best_threshold = 0
+    best_variance = 0.0
+    for level, count in enumerate(histogram):
+        weight_bg += count
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += level * count
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_all - sum_bg) / weight_fg
+        variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            best_threshold = level
+    return best_threshold
+
+
+def _binarize(img: Image.Image) -> Image.Image:
+    """Threshold a page image to black/white so Tesseract can skip its own binarisation pass."""
+    gray = img if img.mode == "L" else img.convert("L")
+    threshold = _otsu_threshold(gray.histogram())
+    return gray.point([0 if level <= threshold else 255 for level in range(256)])
+
+
+def _ocr_image(img: Image.Image) -> str:
+    """OCR one page image, preferring the shared in-process tesserocr API over a pytesseract subprocess."""
+    text = tesserocr_ocr(img)
+    if text is not None:
+        return text
+    if OCR_AVAILABLE and pytesseract:
+        return pytesseract.image_to_string(img, config=OCR_TESSERACT_CONFIG)
+    raise RuntimeError("No OCR engine available")
+
+
+def _ocr_page(page_no: int, img: Image.Image) -> Tuple[Optional[str], Optional[str]]:
+    """OCR one page image (binarised first if enabled); returns (text, error message)."""
+    try:
+        logger.debug("[SDS_EXTRACTOR] Running OCR on page %d...", page_no)
+        if OCR_BINARIZE:
+            img = _binarize(img)
+        page_text = _ocr_image(img)
+        logger.debug("[SDS_EXTRACTOR] OCR page %d: %d chars extracted", page_no, len(page_text))
+        # Per-page sample is for debugging only; skip building it otherwise
+        if logger.isEnabledFor(logging.DEBUG) and page_text.strip():
+            sample = page_text.strip()[:100].replace('\n', ' ')
+            logger.debug("[SDS_EXTRACTOR] OCR page %d sample: '%s...'", page_no, sample)
+        return page_text, None
+    except Exception as page_error:
+        err = f"OCR failed for page {page_no}: {page_error}"
+        logger.exception(f"[SDS_EXTRACTOR] {err}")
+        return None, err
+
+
+def _ocr_page_batch(pages: List[Tuple[int, Image.Image]]) -> List[Tuple[Optional[str], Optional[str]]]:
+    """OCR several pages with a single pytesseract call over an image-list file.
+
+    Tesseract writes a page separator (form feed) between pages, which splits the output back
+    into per-page text. Falls back to page-by-page OCR if the call fails or the page count
+    does not come back, so per-page errors are still reported.
+    """
+    if len(pages) < 2:
+        return [_ocr_page(page_no, img) for page_no, img in pages]
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for page_no, img in pages:
+                if OCR_BINARIZE:
+                    img = _binarize(img)
+                path = os.path.join(tmp_dir, f"page_{page_no}.png")
+                img.save(path)
+                paths.append(path)
+            list_path = os.path.join(tmp_dir, "pages.txt")
+            with open(list_path, "w") as f:
+                f.write("\n".join(paths) + "\n")
+            text = pytesseract.image_to_string(list_path, config=OCR_TESSERACT_CONFIG)
+        page_texts = text.split("\f")
+        # Older tesseract versions also terminate the last page with the separator
+        if len(page_texts) == len(pages) + 1 and not page_texts[-1].strip():
+            page_texts.pop()
+        if len(page_texts) == len(pages):
+            logger.debug("[SDS_EXTRACTOR] Batch OCR of %d pages: %d chars extracted", len(pages), len(text))
+            return [(page_text, None) for page_text in page_texts]
+        logger.warning(
+            f"[SDS_EXTRACTOR] Batch OCR returned {len(page_texts)} pages for {len(pages)} images, retrying page by page"
+        )
+    except Exception as e:
+        logger.warning(f"[SDS_EXTRACTOR] Batch OCR failed, retrying page by page: {e}")
+    return [_ocr_page(page_no, img) for page_no, img in pages]
+
+
+def _ocr_pages(page_numbers: List[int], images: List[Image.Image]) -> List[Tuple[Optional[str], Optional[str]]]:
+    """OCR page images; returns (text, error) per page in page order.
+
+    With tesserocr every page goes through the one shared, locked API, so pages are
+    recognised one at a time. Only the pytesseract fallback runs up to OCR_WORKERS tesseract
+    processes concurrently.
+    """
+    if tesserocr_ready():
+        # Recognition is serialised on the shared engine; worker threads would only add overhead
+        return [_ocr_page(page_no, img) for page_no, img in zip(page_numbers, images)]
+    if len(images) >= OCR_BATCH_MIN_PAGES and OCR_AVAILABLE and pytesseract:
+        # One tesseract process per contiguous run of pages instead of one per page
+        pages = list(zip(page_numbers, images))
+        size = -(-len(pages) // min(OCR_WORKERS, len(pages)))
+        batches = [pages[start:start + size] for start in range(0, len(pages), size)]
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                batch_results = list(executor.map(_ocr_page_batch, batches))
+        else:
+            batch_results = [_ocr_page_batch(batches[0])]
+        return [result for batch in batch_results for result in batch]
+    if len(images) > 1 and OCR_WORKERS > 1:
+        with ThreadPoolExecutor(max_workers=min(OCR_WORKERS, len(images))) as executor:
+            return list(executor.map(_ocr_page, page_numbers, images))
+    return [_ocr_page(page_no, img) for page_no, img in zip(page_numbers, images)]
+
+
 def extract_text(path: Path) -> Tuple[str, Optional[str]]:
-    """Extract text from PDF with multiple fallback methods and improved OCR triggering."""
+    """Extract text from PDF with multiple fallback methods and improved OCR triggering.
+
+    Pages are read in order; PyMuPDF and OCR stop one page (or OCR run) after sections 1 and 14
+    are complete, wherever in the document section 14 turns up.
+    """
     logger.info(f"[SDS_EXTRACTOR] Starting text extraction from: {path}")
 
     best_text = ""
     extraction_method = None
     ocr_error: Optional[str] = None
+    # Page count as reported by the first extractor that opens the document
+    page_count: Optional[int] = None
+    # PyMuPDF stopped early because sections 1 and 14 were already complete
+    sections_located = False
+    # "text", "scanned" or "mixed", from the PyMuPDF text-layer density of each page
+    doc_kind = "text"
+    # Text length accepted without trying the slower extractors, scaled down for short documents
+    sufficient_length = SUFFICIENT_TEXT_LENGTH
+    # Some earlier extractor read the text layer without raising (however little it held)
+    text_layer_read = False
+    ocr_available = (TESSEROCR_AVAILABLE and tesserocr) or (OCR_AVAILABLE and pytesseract)
     
     # Method 1: PyMuPDF (if available - fastest)
     if PYMUPDF_AVAILABLE and fitz:
         try:
             logger.info("[SDS_EXTRACTOR] Attempting PyMuPDF text extraction...")
             doc = fitz.open(str(path))
-            logger.info(f"[SDS_EXTRACTOR] PDF opened, pages: {len(doc)}")
+            page_count = len(doc)
+            logger.info(f"[SDS_EXTRACTOR] PDF opened, pages: {page_count}")
             
-            text = ""
-            for i, page in enumerate(doc):
+            parts = []
+            image_pages = []
+            section_14_seen = False
+            for i in range(page_count):
+                page = doc[i]
                 page_text = page.get_text()
-                text += page_text
+                parts.append(page_text)
+                image_pages.append(_is_image_page(page, page_text))
                 if i == 0:  # Log first page for debugging
-                    logger.info(f"[SDS_EXTRACTOR] PyMuPDF page 1: {len(page_text)} chars")
+                    logger.debug("[SDS_EXTRACTOR] PyMuPDF page 1: %d chars", len(page_text))
+                if sections_located:
+                    # One page past the sections, so no header match ends at a page cut
+                    break
+                section_14_seen = section_14_seen or bool(_RE_SECTION_14_START.search(page_text))
+                if section_14_seen:
+                    sections_located = _sections_located("".join(parts))
+
+            doc_kind = _classify(image_pages)
+            if doc_kind == "mixed" and not sections_located and ocr_available:
+                # Text document with some image-only pages (scanned inserts): OCR just those pages
+                ocr_slots = [n for n, is_image in enumerate(image_pages) if is_image][:OCR_MAX_PAGES]
+                logger.info(f"[SDS_EXTRACTOR] OCR'ing {len(ocr_slots)} image-only page(s) of a text PDF")
+                results = _ocr_pages([n + 1 for n in ocr_slots], [_render_page(doc, n) for n in ocr_slots])
+                for n, (page_text, _err) in zip(ocr_slots, results):
+                    if page_text and page_text.strip():
+                        parts[n] = page_text
             
             doc.close()
-            logger.info(f"[SDS_EXTRACTOR] PyMuPDF extracted {len(text)} characters total")
+            text = "".join(parts)
+            logger.info(f"[SDS_EXTRACTOR] PyMuPDF extracted {len(text)} characters from {len(parts)} page(s)")
+            # A one- or two-page SDS can be complete well short of SUFFICIENT_TEXT_LENGTH
+            sufficient_length = min(SUFFICIENT_TEXT_LENGTH, max(len(parts), 1) * SUFFICIENT_TEXT_PER_PAGE)
+            text_layer_read = True
             
             if len(text.strip()) > len(best_text.strip()):
                 best_text = text
@@ -48,20 +262,66 @@ def extract_text(path: Path) -> Tuple[str, Optional[str]]:
                 
         except Exception as e:
             logger.error(f"[SDS_EXTRACTOR] PyMuPDF extraction failed: {e}")
+
+    # PyMuPDF output this large (or already holding sections 1 and 14) won't trigger OCR and
+    # the slower extractors rarely improve on it
+    if sections_located or (doc_kind != "scanned" and len(best_text.strip()) >= sufficient_length):
+        logger.info(f"[SDS_EXTRACTOR] Sufficient text from {extraction_method} ({len(best_text)} chars), skipping fallbacks")
+        return best_text, None
+
+    # Image-only pages have no text layer for the other extractors either; go straight to OCR
+    scanned = doc_kind == "scanned" and bool(ocr_available)
+    if scanned:
+        logger.info("[SDS_EXTRACTOR] Scanned PDF (no usable text layer), skipping text extractors")
     
-    # Method 2: pdfplumber (reliable for text-based PDFs)
-    if PDFPLUMBER_AVAILABLE and pdfplumber:
+    # Method 2: pypdfium2 (PDFium engine - raw text only, much faster than pdfplumber)
+    if not scanned and PYPDFIUM2_AVAILABLE and pdfium:
+        try:
+            logger.info("[SDS_EXTRACTOR] Attempting pypdfium2 text extraction...")
+            pdf = pdfium.PdfDocument(str(path))
+            try:
+                page_count = len(pdf)
+                parts = []
+                for i in range(page_count):
+                    page = pdf[i]
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    # PDFium emits CRLF line breaks; normalise for the line-anchored regexes
+                    parts.append(page_text.replace("\r\n", "\n"))
+                    if i == 0:
+                        logger.debug("[SDS_EXTRACTOR] pypdfium2 page 1: %d chars", len(page_text))
+                text = "".join(parts)
+            finally:
+                pdf.close()
+
+            logger.info(f"[SDS_EXTRACTOR] pypdfium2 extracted {len(text)} characters total")
+            text_layer_read = True
+
+            if len(text.strip()) > len(best_text.strip()):
+                best_text = text
+                extraction_method = "pypdfium2"
+
+        except Exception as e:
+            logger.error(f"[SDS_EXTRACTOR] pypdfium2 extraction failed: {e}")
+
+    # Fallback: pdfplumber when PDFium bindings are not installed
+    elif not scanned and PDFPLUMBER_AVAILABLE and pdfplumber:
         try:
             logger.info("[SDS_EXTRACTOR] Attempting pdfplumber text extraction...")
             with pdfplumber.open(path) as pdf:
-                text = ""
-                for i, page in enumerate(pdf.pages):
-                    page_text = page.extract_text() or ""
-                    text += page_text
+                page_count = len(pdf.pages)
+                parts = []
+                for i in range(page_count):
+                    page_text = pdf.pages[i].extract_text() or ""
+                    parts.append(page_text)
                     if i == 0:
-                        logger.info(f"[SDS_EXTRACTOR] pdfplumber page 1: {len(page_text)} chars")
+                        logger.debug("[SDS_EXTRACTOR] pdfplumber page 1: %d chars", len(page_text))
+                text = "".join(parts)
             
             logger.info(f"[SDS_EXTRACTOR] pdfplumber extracted {len(text)} characters total")
+            text_layer_read = True
             
             if len(text.strip()) > len(best_text.strip()):
                 best_text = text
@@ -70,16 +330,19 @@ def extract_text(path: Path) -> Tuple[str, Optional[str]]:
         except Exception as e:
             logger.error(f"[SDS_EXTRACTOR] pdfplumber extraction failed: {e}")
     
-    # Method 3: pdfminer.six fallback (always available)
-    if PDFMINER_AVAILABLE and pdfminer_extract:
+    # Method 3: pdfminer.six fallback (always available). It reads the same text layer as the
+    # extractors above, only far slower, so it is a correctness fallback for PDFs none of them
+    # could open rather than a second opinion on short output (short text goes on to OCR instead)
+    if not scanned and not text_layer_read and PDFMINER_AVAILABLE and pdfminer_extract:
         try:
             logger.info("[SDS_EXTRACTOR] Attempting pdfminer.six text extraction...")
             with open(path, 'rb') as f:
-                text = pdfminer_extract(f)
+                # caching=False: don't keep every parsed font/resource alive for the whole document
+                text = pdfminer_extract(f, caching=False)
             
             logger.info(f"[SDS_EXTRACTOR] pdfminer.six extracted {len(text)} characters")
             
-            if len(text.strip()) > len(best_text.strip()):
+            if text.strip():
                 best_text = text
                 extraction_method = "pdfminer.six"
                 
@@ -90,55 +353,69 @@ def extract_text(path: Path) -> Tuple[str, Optional[str]]:
     text_length = len(best_text.strip())
     logger.info(f"[SDS_EXTRACTOR] Best text extraction: {text_length} chars using {extraction_method}")
 
-    # Method 4: OCR fallback (if text is insufficient AND OCR is available)
-    if text_length < MIN_TEXT_LENGTH and OCR_AVAILABLE and pytesseract:
-        logger.warning(f"[SDS_EXTRACTOR] Text too short ({text_length} chars), falling back to OCR...")
+    # Method 4: OCR fallback (if text is insufficient or only a sparse scan overlay, AND OCR is available)
+    if (text_length < MIN_TEXT_LENGTH or scanned) and ocr_available:
+        logger.warning(f"[SDS_EXTRACTOR] Text too short or scanned ({text_length} chars), falling back to OCR...")
         logger.info("[SDS_EXTRACTOR] Converting PDF to images for OCR...")
 
-        images = []
-        if PDF2IMAGE_AVAILABLE and convert_from_path:
-            try:
-                images = convert_from_path(str(path), dpi=300, first_page=1, last_page=10)
-                logger.info(f"[SDS_EXTRACTOR] Converted to {len(images)} images for OCR using pdf2image")
-            except Exception as e:
-                ocr_error = f"convert_from_path failed: {e}"
-                logger.exception(f"[SDS_EXTRACTOR] {ocr_error}")
-                return best_text, ocr_error
-        elif PYMUPDF_AVAILABLE and fitz:
-            try:
-                doc = fitz.open(str(path))
-                for i, page in enumerate(doc):
-                    pix = page.get_pixmap(dpi=300)
-                    img = Image.open(io.BytesIO(pix.tobytes("png")))
-                    images.append(img)
-                doc.close()
-                logger.info(f"[SDS_EXTRACTOR] Converted to {len(images)} images for OCR using PyMuPDF")
-            except Exception as e:
-                ocr_error = f"PyMuPDF image conversion failed: {e}"
-                logger.exception(f"[SDS_EXTRACTOR] {ocr_error}")
-                return best_text, ocr_error
+        # Pages are rendered and OCR'd in order, OCR_RUN_PAGES at a time, until sections 1 and 14
+        # are complete (plus one more run, so no header match ends at a page cut) or OCR_MAX_PAGES
+        if PYMUPDF_AVAILABLE and fitz:
+            # Prefer PyMuPDF rendering: runs in-process, no Poppler subprocess or PNG round-trip
+            renderer = "PyMuPDF"
+        elif PDF2IMAGE_AVAILABLE and convert_from_path:
+            renderer = "pdf2image"
         else:
             ocr_error = "No PDF to image converter available"
             logger.error(f"[SDS_EXTRACTOR] {ocr_error}")
             return best_text, ocr_error
 
-        ocr_text = ""
+        ocr_parts = []
         page_errors = []
-        for i, img in enumerate(images):
-            try:
-                logger.info(f"[SDS_EXTRACTOR] Running OCR on page {i+1}...")
-                page_text = pytesseract.image_to_string(img, config='--psm 1 -l eng')
-                ocr_text += f"\n--- Page {i+1} ---\n{page_text}"
-                logger.info(f"[SDS_EXTRACTOR] OCR page {i+1}: {len(page_text)} chars extracted")
-                if page_text.strip():
-                    sample = page_text.strip()[:100].replace('\n', ' ')
-                    logger.info(f"[SDS_EXTRACTOR] OCR page {i+1} sample: '{sample}...'")
-            except Exception as page_error:
-                err = f"pytesseract failed for page {i+1}: {page_error}"
-                logger.exception(f"[SDS_EXTRACTOR] {err}")
-                page_errors.append(err)
-                continue
+        located = False
+        doc = None
+        try:
+            if renderer == "PyMuPDF":
+                doc = fitz.open(str(path))
+                page_count = len(doc)
+            limit = OCR_MAX_PAGES if page_count is None else min(OCR_MAX_PAGES, page_count)
+            first = 0
+            while first < limit:
+                last = min(first + OCR_RUN_PAGES, limit)
+                try:
+                    if doc is not None:
+                        images = [_render_page(doc, i) for i in range(first, last)]
+                    else:
+                        images = convert_from_path(
+                            str(path), dpi=OCR_DPI, grayscale=True, first_page=first + 1, last_page=last,
+                            thread_count=OCR_WORKERS,
+                        )
+                except Exception as e:
+                    ocr_error = f"{renderer} image conversion failed: {e}"
+                    logger.exception(f"[SDS_EXTRACTOR] {ocr_error}")
+                    if not ocr_parts:
+                        return best_text, ocr_error
+                    break  # keep the pages already OCR'd
+                if not images:
+                    break
+                logger.info(
+                    f"[SDS_EXTRACTOR] Converted pages {first + 1}-{first + len(images)} to images for OCR using {renderer}"
+                )
+                page_numbers = list(range(first + 1, first + len(images) + 1))  # 1-based
+                for page_no, (page_text, err) in zip(page_numbers, _ocr_pages(page_numbers, images)):
+                    if err:
+                        page_errors.append(err)
+                        continue
+                    ocr_parts.append(f"\n--- Page {page_no} ---\n{page_text}")
+                first += len(images)
+                if located:
+                    break
+                located = _sections_located("".join(ocr_parts))
+        finally:
+            if doc is not None:
+                doc.close()
 
+        ocr_text = "".join(ocr_parts)
         logger.info(f"[SDS_EXTRACTOR] OCR extracted {len(ocr_text)} characters total")
 
         if ocr_text.strip():
@@ -148,7 +425,7 @@ def extract_text(path: Path) -> Tuple[str, Optional[str]]:
         ocr_error = "; ".join(page_errors) if page_errors else "OCR produced no text"
         logger.error(f"[SDS_EXTRACTOR] {ocr_error}")
 
-    elif text_length < MIN_TEXT_LENGTH and not OCR_AVAILABLE:
+    elif text_length < MIN_TEXT_LENGTH and not ocr_available:
         ocr_error = "OCR not available"
         logger.error(f"[SDS_EXTRACTOR] Insufficient text ({text_length} chars) and OCR not available")
     else:
@@ -2,11 +2,86 @@
 Text extraction utilities
 """
 import re
+import bisect
+import functools
 import logging
-from .config import NOISE_LABELS, VALID_DG_CLASSES, VALID_PACKING_GROUPS
+from itertools import groupby
+from typing import Dict, Tuple
+from .config import NOISE_LABELS, SECTION_PATTERN, VALID_DG_CLASSES, VALID_PACKING_GROUPS
 
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    'is_noise_text',
+    'clean_company_candidate',
+    'validate_dangerous_goods_class',
+    'build_section_index',
+    'get_section',
+    'strip_doubled_label_prefix',
+    'looks_like_numeric_code',
+    'compress_duplicates_with_map',
+]
+
+# Precompiled patterns (hot paths: called for every candidate value)
+# is_noise_text: NOISE_LABELS entries that are plain words are answered by a set lookup;
+# only the real regexes go into the fused alternation below.
+_NOISE_LABEL_LITERALS = frozenset(p.lower() for p in NOISE_LABELS if p == re.escape(p))
+_NOISE_LABEL_PATTERNS = [p for p in NOISE_LABELS if p != re.escape(p)]
+# Every remaining check fused into one alternation. The \A-anchored branches keep the
+# original fullmatch/match semantics; only the phone-number triplet may occur anywhere.
+_RE_NOISE = re.compile(
+    r'\A(?:' + '|'.join(f'(?:{p})' for p in _NOISE_LABEL_PATTERNS) + r')\Z'
+    r'|\A[:\-\s]*\Z'                                       # Just punctuation
+    r'|\A\d{2,4}[-\s]\d{2,4}[-\s]\d{2,4}\Z'                # Phone number pattern
+    r'|\A(?-i:(?:UK|US|USA|EU|AU|NZ|JP|CN),?\s+[A-Z]{2,4}\b)'  # Country code headers like "UK, NPIS"
+    r'|\b\d{2,4}\s+\d{2,4}\s+\d{2,4}\b',                   # Phone numbers
+    re.IGNORECASE)
+_NOISE_WORDS = frozenset({
+    'name', 'date', 'address', 'contact', 'details', 'information', 'adresse', 'kontakt', 'informationen',
+    'australia', 'new zealand', 'united states', 'united kingdom',
+    'usa', 'uk', 'canada', 'deutschland', 'germany',
+}) | _NOISE_LABEL_LITERALS
+
+_RE_BULLET_PREFIX = re.compile(r"^[\s\-–—:*•■●►➤▼◆▪]+")
+_RE_LABEL_PREFIX = re.compile(
+    r"^(?:Company\s+and\s+address|Company|Manufacturer|Supplier(?:\s+Name)?|Distributor|Producer)\s*[:\-]\s*",
+    re.IGNORECASE)
+_RE_SECTION_HEADER = re.compile(r"^(Section\s*\d+\b|\d+\.?\s*(Identification|Hazard)\b)", re.IGNORECASE)
+_RE_PAREN_REGISTRY = re.compile(r"\s*\([^)]*(?:ABN|ACN|Formerly)\s*[^)]*\)", re.IGNORECASE)
+_NOISE_TOKENS = [
+    r"Association\s*/?\s*Organisation",
+    r"Poisons?\s+Information",
+    r"Poison\s+Information",
+    r"Emergency(?:\s+telephone|\s+phone)?",
+    r"ABN\b",
+    r"ACN\b",
+    r"Address",
+    r"Contact",
+    r"Website",
+    r"Email",
+    r"Tel\.?",
+    r"Phone",
+    r"Fax",
+]
+_RE_NOISE_TOKENS = re.compile(r"\b(?:" + "|".join(_NOISE_TOKENS) + r")\b", re.IGNORECASE)
+_RE_SUFFIX_CLIP = re.compile(
+    r"^(.*?\b(?:PTY\s+LTD|P/L|LTD|LIMITED|INC\.?|CORP\.?|CORPORATION|GMBH|PLC|BV|S\.?A\.?|S\.P\.A\.|LLC))\b.*$",
+    re.IGNORECASE)
+_RE_TRAIL_PUNCT = re.compile(r"[\s,.;:]+$")
+
+# validate_dangerous_goods_class: whole-value "not applicable" responses. Common spellings are
+# a set lookup; everything else goes through one fused fullmatch.
+_NOT_APPLICABLE_LITERALS = frozenset({'n/a', 'na', 'none', 'not applicable', 'not regulated', 'not required'})
+_RE_NOT_APPLICABLE = re.compile(
+    r'not?\s+regulated|not?\s+applicable|not?\s+required|not?\s+subject|none|n/?a|not\s+a\s+dangerous\s+good',
+    re.IGNORECASE)
+
+# Candidate section start: a line beginning with a number, optionally prefixed by "Section"
+_RE_SECTION_START = re.compile(r'^\s*(?:section\s*)?(\d+)\b[^\n]*', re.IGNORECASE | re.MULTILINE)
+
+_RE_LETTERS = re.compile(r"[A-Za-z]")
+_RE_DIGIT = re.compile(r"\d")
+
 
 def is_noise_text(text: str) -> bool:
     """Check if text is likely noise (labels, contact info, etc.) that shouldn't be extracted as values."""
@@ -15,30 +90,15 @@ def is_noise_text(text: str) -> bool:
     
     text_clean = text.strip()
     
-    # Check against noise patterns
-    for pattern in NOISE_LABELS:
-        if re.fullmatch(pattern, text_clean, re.IGNORECASE):
-            return True
-    
-    # Additional checks for common noise patterns
-    if re.match(r'^[:\-\s]*$', text_clean):  # Just punctuation
-        return True
-    if re.match(r'^\d{2,4}[-\s]\d{2,4}[-\s]\d{2,4}$', text_clean):  # Phone number pattern
-        return True
-    # Country code headers like "UK, NPIS" (be conservative to avoid rejecting real product names)
-    if re.match(r'^(UK|US|USA|EU|AU|NZ|JP|CN),?\s+[A-Z]{2,4}\b', text_clean):
-        return True
-    if re.search(r'\b\d{2,4}\s+\d{2,4}\s+\d{2,4}\b', text_clean):  # Phone numbers
-        return True
-    if text_clean.lower() in ['name', 'date', 'address', 'contact', 'details', 'information', 'adresse', 'kontakt', 'informationen']:
+    # Cheap checks first: bare label words, then whether any digit is present at all
+    if text_clean.lower() in _NOISE_WORDS:
         return True
-    if text_clean.lower() in {
-        'australia', 'new zealand', 'united states', 'united kingdom',
-        'usa', 'uk', 'canada', 'deutschland', 'germany'
-    }:
-        return True
-
-    return False
+    # Labels, punctuation-only values, phone numbers and country code headers
+    # (be conservative with the latter to avoid rejecting real product names).
+    # Without digits only the start-anchored branches can match, so skip the scan.
+    if _RE_DIGIT.search(text_clean):
+        return bool(_RE_NOISE.search(text_clean))
+    return bool(_RE_NOISE.match(text_clean))
 
 
 def clean_company_candidate(value: str) -> str:
@@ -55,49 +115,30 @@ def clean_company_candidate(value: str) -> str:
     s = value.strip()
 
     # 1) Remove leading bullets/arrows and punctuation noise
-    s = re.sub(r"^[\s\-–—:*•■●►➤▼◆▪]+", "", s)
+    s = _RE_BULLET_PREFIX.sub("", s)
 
     # 2) Remove inline label prefixes that sometimes bleed into the value
-    s = re.sub(r"^(?:Company\s+and\s+address|Company|Manufacturer|Supplier(?:\s+Name)?|Distributor|Producer)\s*[:\-]\s*",
-               "", s, flags=re.IGNORECASE)
+    s = _RE_LABEL_PREFIX.sub("", s)
 
     # 3) If string is a section header, reject
-    if re.match(r"^(Section\s*\d+\b|\d+\.?\s*(Identification|Hazard)\b)", s, re.IGNORECASE):
+    if _RE_SECTION_HEADER.match(s):
         return ''
 
     # 4) Remove parentheses containing registry/formerly info
-    s = re.sub(r"\s*\([^)]*(?:ABN|ACN|Formerly)\s*[^)]*\)", "", s, flags=re.IGNORECASE)
+    s = _RE_PAREN_REGISTRY.sub("", s)
 
     # 5) Trim after known noise tokens
-    noise_tokens = [
-        r"Association\s*/?\s*Organisation",
-        r"Poisons?\s+Information",
-        r"Poison\s+Information",
-        r"Emergency(?:\s+telephone|\s+phone)?",
-        r"ABN\b",
-        r"ACN\b",
-        r"Address",
-        r"Contact",
-        r"Website",
-        r"Email",
-        r"Tel\.?",
-        r"Phone",
-        r"Fax",
-    ]
-    pattern = re.compile(r"\b(?:" + "|".join(noise_tokens) + r")\b", re.IGNORECASE)
-    m = pattern.search(s)
+    m = _RE_NOISE_TOKENS.search(s)
     if m:
         s = s[:m.start()].strip()
 
     # 6) If a corporate suffix is present, clip anything after it
-    suffix_clip = re.compile(r"^(.*?\b(?:PTY\s+LTD|P/L|LTD|LIMITED|INC\.?|CORP\.?|CORPORATION|GMBH|PLC|BV|S\.?A\.?|S\.P\.A\.|LLC))\b.*$",
-                             re.IGNORECASE)
-    sm = suffix_clip.match(s)
+    sm = _RE_SUFFIX_CLIP.match(s)
     if sm:
         s = sm.group(1).strip()
 
     # 7) Remove trailing commas/periods and stray punctuation
-    s = re.sub(r"[\s,.;:]+$", "", s)
+    s = _RE_TRAIL_PUNCT.sub("", s)
 
     return s.strip()
 
@@ -114,42 +155,43 @@ def validate_dangerous_goods_class(value: str) -> bool:
         return True
     
     # Check for valid "not applicable" type responses
-    not_applicable_patterns = [
-        r'not?\s+regulated',
-        r'not?\s+applicable',
-        r'not?\s+required',
-        r'not?\s+subject',
-        r'none',
-        r'n/?a',
-        r'not\s+a\s+dangerous\s+good'
-    ]
-    
-    for pattern in not_applicable_patterns:
-        if re.fullmatch(pattern, value, re.IGNORECASE):
-            return True
-    
-    return False
+    return value.lower() in _NOT_APPLICABLE_LITERALS or bool(_RE_NOT_APPLICABLE.fullmatch(value))
+
+
+@functools.lru_cache(maxsize=2)
+def build_section_index(text: str) -> Dict[int, Tuple[int, int]]:
+    """Map each section number to its (start, end) offsets in ``text`` with one pass per pattern.
+
+    ``start`` is the end of the first line that begins with the number (optionally prefixed by
+    "Section"); ``end`` is the start of the next section header with a higher number.
+    Memoised per text, so extracting several sections of one document scans it only once.
+    """
+    headers = [(m.start(), int(m.group(1))) for m in SECTION_PATTERN.finditer(text)]
+    header_positions = [pos for pos, _ in headers]
+
+    index: Dict[int, Tuple[int, int]] = {}
+    for m in _RE_SECTION_START.finditer(text):
+        digits = m.group(1)
+        number = int(digits)
+        # Only the canonical spelling counts ("1", not "01"), as a literal number pattern would
+        if number in index or digits != str(number):
+            continue
+        start = m.end()
+        end = len(text)
+        for pos, num in headers[bisect.bisect_left(header_positions, start):]:
+            if num > number:
+                end = pos
+                break
+        index[number] = (start, end)
+    return index
 
 
 def get_section(text: str, number: int) -> str:
     """Extract a specific numbered section from the SDS text"""
-    from .config import SECTION_PATTERN
-    
-    pattern = re.compile(rf'^\s*(?:section\s*)?{number}\b[^\n]*', re.IGNORECASE | re.MULTILINE)
-    match = pattern.search(text)
-    if not match:
+    bounds = build_section_index(text).get(number)
+    if not bounds:
         return ''
-    
-    start = match.end()
-    end = len(text)
-    
-    # Find the start of the next section
-    for m in SECTION_PATTERN.finditer(text, start):
-        num = int(m.group(1))
-        if num > number:
-            end = m.start()
-            break
-    
+    start, end = bounds
     return text[start:end]
 
 
@@ -158,10 +200,11 @@ def _compress_consecutive_duplicates(token: str) -> str:
 
     This is used for recognizing corrupted labels. Do not apply blindly to product names
     because it would incorrectly change legitimate double letters (e.g., 'Bitter').
+    Expects a whitespace-free token (as produced by ``str.split``).
     """
     if not token:
         return token
-    return __import__('re').sub(r"(.)\1+", r"\1", token)
+    return "".join([ch for ch, _ in groupby(token)])
 
 
 def strip_doubled_label_prefix(text: str) -> str:
@@ -188,16 +231,15 @@ def strip_doubled_label_prefix(text: str) -> str:
     ]
 
     parts = raw.split()
+    # Normalize and compress duplicates of the (at most 3) head tokens once for all labels
+    norm_parts = [
+        _compress_consecutive_duplicates(p).upper().strip(" :\t-._") for p in parts[:3]
+    ]
     # Try to match any label at the beginning (2-3 tokens)
     for tokens in labels:
         n = len(tokens)
         if len(parts) >= n:
-            head = parts[:n]
-            # Normalize and compress duplicates for comparison
-            norm_head = [
-                _compress_consecutive_duplicates(p).upper().strip(" :\t-._") for p in head
-            ]
-            if norm_head == tokens:
+            if norm_parts[:n] == tokens:
                 remainder = " ".join(parts[n:]).lstrip(" :\t-._").strip()
                 return remainder or raw
 
@@ -210,7 +252,7 @@ def looks_like_numeric_code(value: str) -> bool:
         return False
     s = value.strip()
     # Consider codes with >= 6 digits and no letters as numeric codes
-    if len(s) >= 6 and not __import__('re').search(r"[A-Za-z]", s) and __import__('re').search(r"\d", s):
+    if len(s) >= 6 and not _RE_LETTERS.search(s) and _RE_DIGIT.search(s):
         return True
     return False
 
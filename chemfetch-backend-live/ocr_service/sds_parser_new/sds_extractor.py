@@ -3,10 +3,19 @@
 FIXED SDS extractor - preserves working functionality while addressing specific issues
 """
 import re
+import os
 import logging
 import json
+import bisect
+import functools
+import hashlib
+import itertools
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Pattern, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     import fitz
@@ -69,6 +78,9 @@ try:
         extract_date_from_header as fe_extract_date_from_header,
     )
     from .modules.utils import clean_company_candidate as fe_clean_company
+    from .modules.date_parser import extract_issue_date as mod_extract_issue_date
+    from .modules.dependencies import tesserocr_ocr, tesserocr_ready
+    from .modules.config import AVAILABLE_CPUS, MAX_TEXT_CHARS, OCR_DPI, OCR_TESSERACT_CONFIG, OCR_WORKERS, RESULT_CACHE_DIR, VALID_PACKING_GROUPS
 except ImportError:  # pragma: no cover - fallback when run as script
     from modules.section_1 import (
         description as fe_extract_description,
@@ -80,6 +92,9 @@ except ImportError:  # pragma: no cover - fallback when run as script
         extract_date_from_header as fe_extract_date_from_header,
     )
     from modules.utils import clean_company_candidate as fe_clean_company
+    from modules.date_parser import extract_issue_date as mod_extract_issue_date
+    from modules.dependencies import tesserocr_ocr, tesserocr_ready
+    from modules.config import AVAILABLE_CPUS, MAX_TEXT_CHARS, OCR_DPI, OCR_TESSERACT_CONFIG, OCR_WORKERS, RESULT_CACHE_DIR, VALID_PACKING_GROUPS
 
 # Common field labels used to trim values when multiple labels appear on one line
 COMMON_FIELD_LABELS = [
@@ -115,6 +130,202 @@ COMMON_FIELD_LABELS = [
     r'Hazard\s*class(?:\(es\))?',
 ]
 
+# Precompiled patterns (is_noise_text and extract_field_value run for every candidate line)
+# Any common label; one search finds the leftmost label that leaked into a value
+_RE_COMMON_FIELD_LABEL = re.compile('|'.join(f'(?:{other})' for other in COMMON_FIELD_LABELS), re.IGNORECASE)
+
+# Specific noise patterns found in test results
+_NOISE_PATTERNS = [
+    r'^MSDS\s+Date$',
+    r'^Alternative\s+number\(s\)$',
+    r'^Facsimile\s+Number$',
+    r'^safety\s+data\s+sheet$',
+    r'^Name$',
+    r'^Registered\s+company\s+name$',
+    r'^\:$',
+    r"^[’'`´]s$",
+    r'^UK,?\s+NPIS.*\d{2,4}\s+\d{2,4}\s+\d{2,4}',
+    r'^Australia\s+-\s+\d{2,4}\s+\d{2,4}\s+\d{2,4}',
+    r'^\d{2,4}[-\s]\d{2,4}[-\s]\d{2,4}',
+    r'^Emergency\s+telephone',
+    r'^Contact\s+details',
+    r'^Details\s+of\s+the\s+supplier$',
+    r'^Telephone',
+    r'^Phone',
+    r'^Fax',
+    r'^Email',
+    r'^Address',
+    r'^Website',
+    r'^Emergency\s+Telephone\s+Number$',
+    r'^Company[:.]?\s*$',
+    r'^Company\s+No\.?[:.]?\s*$',
+    r'^Other\s+Name\(s\)$',
+    r'^Formulation\s+#$',
+    r'^Registration\s+no\.?\s*–?\s*US:?\s*$',
+    r'^Group$',
+    r'^Synonyms',
+    r'^Product\s+Code',
+    r'^HS\s+Code',
+    r'^-\s*-$',
+]
+# All noise patterns as one alternation; each branch is its own group so lastindex names the match
+_RE_NOISE = re.compile('|'.join(f'({p})' for p in _NOISE_PATTERNS), re.IGNORECASE)
+# Opening atom of an anchored pattern: \d, a plain character class, an escaped symbol or a literal
+_RE_PATTERN_FIRST_ATOM = re.compile(r"\^(\\d|\[[^\]\\-]+\]|\\\W|[^\\\[(.])")
+
+
+def _noise_first_chars() -> frozenset:
+    """Lower-cased characters a _NOISE_PATTERNS match can start with, derived from the patterns.
+
+    Digits are left to ``isdecimal``. Non-ASCII characters IGNORECASE matches to a letter (e.g.
+    'ſ' for 's') are included, as is_noise_text compares ``text[0].lower()``.
+    """
+    chars = set()
+    for pattern in _NOISE_PATTERNS:
+        atom = _RE_PATTERN_FIRST_ATOM.match(pattern)
+        if atom is None:
+            raise ValueError(f"Noise pattern must open with ^ and a literal, escape or class: {pattern!r}")
+        first = atom.group(1)
+        if first == r'\d':
+            continue
+        chars.update(first.strip('[]') if first.startswith('[') else first[-1])
+    letters = ''.join(c for c in chars if c.isalpha())
+    if letters:
+        folded = re.compile(f'[{letters}]', re.IGNORECASE).findall(''.join(map(chr, range(0x80, 0x10000))))
+        chars.update(folded)
+    return frozenset(c.lower() for c in chars)
+
+
+# Every noise pattern is anchored at the start, so a value whose first character (lower-cased,
+# or a digit) is not in this set cannot match
+_NOISE_FIRST_CHARS = _noise_first_chars()
+_RE_SHORT_DG_CLASS = re.compile(r"^\d(?:\.\d)?$")
+
+_LEADING_LABEL_SOURCES = [
+    r"(?:product\s+identifier)\s*[:\-]?\s*",
+    r"(?:product\s+name)\s*[:\-]?\s*",
+    r"(?:trade\s+name)\s*[:\-]?\s*",
+    r"(?:commercial\s+product\s+name)\s*[:\-]?\s*",
+    r"(?:manufacturer|supplier\s+name|supplier|company\s+name\s+of\s+supplier|producer|company\s+name|registered\s+company\s+name|distributor)\s*[:\-]?\s*",
+]
+# Labels can be stacked ("Product name: Trade name: X"); each is stripped at most once and only
+# in the order above, so one anchored chain of optional groups does it in a single sub.
+# Leading whitespace is only skipped after the first label position, as sequential
+# sub()/strip() passes would.
+_RE_LEADING_LABELS = re.compile(
+    r'^(?:' + _LEADING_LABEL_SOURCES[0] + r'|\s*)' + ''.join(f'(?:{p})?' for p in _LEADING_LABEL_SOURCES[1:]),
+    re.IGNORECASE)
+
+_RE_DG_CLASS = re.compile(r'^[1-9](?:\.[1-9])?$')
+# The usual N/A spellings are answered by a set lookup; the rest go through the fused prefixes
+_DG_NA_LITERALS = frozenset({'n/a', 'na', 'none', 'not applicable', 'not regulated'})
+_RE_DG_NA = re.compile(
+    r'^(?:not?\s+regulated|not?\s+applicable|none$|n/?a$|not\s+a\s+dangerous\s+good|not\s+subject\s+to)',
+    re.IGNORECASE)
+# Packing group cell values that VALID_PACKING_GROUPS accepts, lower-cased, for the common case
+_PACKING_GROUP_LITERALS = frozenset({'i', 'ii', 'iii', 'iv', 'n/a', 'na', 'none'})
+# Section 14 table scans (extract_dg_class_from_table / extract_packing_group_from_table)
+_RE_MODAL_HEADERS = re.compile(r'\bADG\b.*\bIMDG\b.*\bIATA\b', re.IGNORECASE)
+_RE_TRANSPORT_HAZARD = re.compile(r'Transport\s+hazard', re.IGNORECASE)
+_RE_TRANSPORT_HAZARD_PREFIX = re.compile(r'^.*?Transport\s+hazard\s*(?:class(?:\(es\))?)?\s*', re.IGNORECASE)
+_RE_DG_CLASS_LABEL = re.compile(r'DG\s*Class|Class\s*:', re.IGNORECASE)
+_RE_PACKING_GROUP_LABEL = re.compile(r'packing\s+group', re.IGNORECASE)
+_RE_PACKING_GROUP_PREFIX = re.compile(r'^.*?packing\s+group\s*', re.IGNORECASE)
+# Table cells: runs of 2+ spaces, tabs or pipes (single spaces stay inside a cell)
+_RE_TABLE_CELL_SPLIT = re.compile(r'\s{2,}|\t|\|')
+
+# get_section: every line start that opens a candidate section header (zero-width, so
+# headers on consecutive lines are all seen). Group 1 spans the header line, group 2 is the
+# leading non-word run, then the number and the optional punctuation after it.
+_RE_HEADER_CANDIDATE = re.compile(
+    r'^(?=((\W*)(?:section\s*)?(\d{1,2})\s*([:\.-]?)\s.*$))', re.IGNORECASE | re.MULTILINE)
+# get_section: header of any subsequent section
+_RE_NEXT_SECTION = re.compile(r'^(?=\W*(?:section\s*)?\d{1,2}\s*[:\.-]\s)', re.IGNORECASE | re.MULTILINE)
+# Sections whose header may carry leading bullets/symbols and omit the punctuation after the
+# number (Identification can be OCR-mangled); all others need "N." / "N:" to skip addresses
+_RELAXED_HEADER_SECTIONS = frozenset({1, 14})
+
+# extract_field_value value clean-up
+_RE_POSSESSIVE_PREFIX = re.compile(r"^[’'`´]+s\b\s*")
+_RE_TRAILING_SEPARATOR = re.compile(r'\s*[:\-]\s*$')
+# Case-sensitive on purpose: the original re.sub call passed re.IGNORECASE as the count argument
+_RE_CONTACT_TAIL = re.compile(r'\s+(Tel|Phone|Fax|Email|Emergency).*$')
+_RE_TRAILING_CODE = re.compile(r'\b[A-Z0-9]{2,}[/A-Z0-9\-]*$')
+_RE_OF_THE_SDS = re.compile(r'^of\s+the\s+safety\s+data\s+sheet\s*$', re.IGNORECASE)
+
+# extract_product_name / extract_manufacturer candidate filters
+_RE_PRODUCT_NAME_REJECT = re.compile(r'^(Pty\s+Ltd|Ltd|Inc\.?|Corp\.?|Company|Alternative\s+number\(s\)|Other\s+Name\(s\)|Formulation\s+#|Registration\s+no\.?\s*–?\s*US:?|Group)$', re.IGNORECASE)
+_RE_PRODUCT_LABEL_ONLY = re.compile(r'(product\s+identifier|product\s+name|trade\s+name|commercial\s+product\s+name)')
+_RE_LINE_HEADER = re.compile(r'^\d+\.|\bsection\b|\bidentification\b', re.IGNORECASE)
+_RE_SYNONYMS_LINE = re.compile(r'^synonym\(s\)', re.IGNORECASE)
+_RE_USE_LINE = re.compile(r'^(use\(s\)|use of the substance|recommended use)', re.IGNORECASE)
+_RE_SDS_DATE_LINE = re.compile(r'^(msds|sds)\s+date\b', re.IGNORECASE)
+_RE_ALNUM = re.compile(r'[A-Za-z0-9]')
+_RE_WEB_OR_EMAIL = re.compile(r'@|www\.|\.com|\.org', re.IGNORECASE)
+_RE_PUNCT_ONLY = re.compile(r'^[:\-\s]+$')
+# Substrings of a lower-cased line (plain substring tests, hence case-sensitive and unbounded)
+_RE_PN_CONTACT_WORDS = re.compile(r'supplier|emergency|telephone|contact|details')
+_RE_PN_TRANSPORT_WORDS = re.compile(r'shipping name|un number|transport|hazchem|epg|chemical formula|not applicable')
+_RE_LABEL_LINE = re.compile(r'^(Alternative\s+number\(s\)|Other\s+Name\(s\)|Formulation\s+#|Registration\s+no\.?\s*–?\s*US:?|Group)$', re.IGNORECASE)
+_RE_DATE_HEADER_LINE = re.compile(r'^(msds\s+date|date\s+of\s+issue|revision\s+date|version\s+date)\b', re.IGNORECASE)
+_RE_MANUFACTURER_REJECT = re.compile(r'^(of\s+the\s+safety\s+data\s+sheet|Emergency\s+Telephone\s+Number|Company[:.]?\s*$|Company\s+No\.?[:.]?\s*$)$', re.IGNORECASE)
+_RE_SUPPLIER_DETAILS = re.compile(r'Details\s+of\s+the\s+supplier[^\n]*\n', re.IGNORECASE)
+# Start of the line that ends a supplier details block (matched just after a newline)
+_RE_SUPPLIER_BLOCK_END = re.compile(r'\s*(?:[A-Z][a-z]|\d)', re.IGNORECASE)
+_SUPPLIER_BLOCK_MAX_CHARS = 500
+_RE_PHONE_NUMBER = re.compile(r'\b\d{2,4}[-\s]\d{2,4}[-\s]\d{2,4}\b')
+_RE_SUPPLIER_NOISE_LINE = re.compile(r'^(Emergency\s+Telephone\s+Number|Company[:.]?\s*$)', re.IGNORECASE)
+_RE_SDS_HEADER_LINE = re.compile(r'safety\s+data\s+sheet|^section\b|^page\b', re.IGNORECASE)
+
+# extract_date: labelled date patterns. Labels are located in a lower-cased copy of the text
+# with a case-sensitive scan (much cheaper than an IGNORECASE alternation tried at every
+# offset); the full IGNORECASE pattern then runs only where a label starts.
+_ISO_DATE_LABELS = r'(Issue\s*Date|Revision(?:\s*Date)?|Date\s*of\s*issue|Version\s*date|Date\s*Prepared|Prepared\s*on|Issued)'
+_RE_ISO_LABELED_DATE = re.compile(_ISO_DATE_LABELS + r'[^\n]{0,60}?(\d{4}-\d{2}-\d{2})', re.IGNORECASE)
+_DATE_LABELS = (
+    r'(?:Issue\s*Date|Revision(?:\s*Date)?|Date\s*of\s*issue|Version\s*date|Date\s*Prepared|Prepared\s*on|Issued|'
+    r'MSDS\s*Date|SDS\s*Date|Last\s*Updated|Last\s*Revision|Last\s*Revised|Updated\s*on|Last\s*Modified|Effective\s*Date)'
+)
+_DATE_FORMATS = (
+    r'(\d{1,2}[\-\/\.]+\d{1,2}[\-\/\.]+\d{2,4}|\d{4}-\d{2}-\d{2}|[A-Za-z]+\.?\s+\d{1,2},?\s*\d{4}|'
+    r'\d{1,2}\s+[A-Za-z]+\.?\s+\d{4}|\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4}|[A-Za-z]+\.?\s+\d{4})'
+)
+_RE_REVISION_LABEL = re.compile(r'revision')
+# (labelled date pattern, its label start in lower-cased text), in priority order
+_ISO_DATE_PATTERN = (_RE_ISO_LABELED_DATE, re.compile(_ISO_DATE_LABELS.lower()))
+_LEGACY_DATE_PATTERNS = [
+    # Labeled + various formats, including dd-MMM-YYYY
+    (re.compile(_DATE_LABELS + r'[^\n]{0,40}?[:\-]?\s*' + _DATE_FORMATS, re.IGNORECASE), re.compile(_DATE_LABELS.lower())),
+    (re.compile(r'Revision[:\s]*(\d{4}-\d{2}-\d{2})', re.IGNORECASE), _RE_REVISION_LABEL),
+    (re.compile(r'Revision[:\s]*(\d{1,2}[\-\/]\d{1,2}[\-\/]\d{4})', re.IGNORECASE), _RE_REVISION_LABEL),
+    (re.compile(r'Revision[:\s]*(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})', re.IGNORECASE), _RE_REVISION_LABEL),
+    (re.compile(r'REVISION\s+DATE[:\s]*(\d{1,2}\s+\w+\.?\s+\d{4})', re.IGNORECASE), _RE_REVISION_LABEL),
+    (re.compile(r'REVISION\s+DATE[:\s]*(\d{1,2}[\-\/]\d{1,2}[\-\/]\d{4})', re.IGNORECASE), _RE_REVISION_LABEL),
+    (re.compile(r'REVISION\s+DATE[:\s]*(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})', re.IGNORECASE), _RE_REVISION_LABEL),
+]
+# Characters IGNORECASE treats as ASCII letters that str.lower() leaves alone (or lengthens)
+_DATE_CASE_FOLD_CHARS = 'ıİſ'
+_DATE_CASE_FOLD = str.maketrans({'ı': 'i', 'İ': 'i', 'ſ': 's'})
+# strptime formats for labelled dates, in priority order (day-first before month-first).
+# Each is paired with the literal separators it needs and whether it needs a month name, so
+# only the formats a candidate's shape can satisfy are attempted.
+_STRPTIME_DATE_FORMATS = tuple(
+    (fmt, frozenset(fmt) & frozenset('/-. '), '%b' in fmt or '%B' in fmt)
+    for fmt in ('%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d', '%d-%m-%Y', '%d.%m.%Y', '%d %b %Y', '%d %B %Y',
+                '%b %d %Y', '%B %d %Y', '%d-%b-%Y', '%d-%b-%y', '%d.%b.%Y', '%d.%b.%y')
+)
+_STRPTIME_MONTH_YEAR_FORMATS = ('%b %Y', '%B %Y')
+_RE_FOUR_DIGIT_YEAR = re.compile(r'\b\d{4}\b')
+_RE_MONTH_ABBREV_DOT = re.compile(r'\b([A-Za-z]{3,})\.')
+_RE_MONTH_YEAR = re.compile(r'([A-Za-z]+)\s+(\d{4})')
+# parse_pdf final validation: product name/manufacturer values that are really labels or headers
+_RE_FINAL_LABEL_LIKE = re.compile(r'(product\s+identifier|product\s+name|trade\s+name|commercial\s+product\s+name)\s*$', re.IGNORECASE)
+_RE_FINAL_HEADER_LIKE = re.compile(r'^\s*\d+\.?\s*(identification|hazard)\b', re.IGNORECASE)
+# parse_pdf fallbacks: SDS header mentions (searched in a lowered value) and product-name labels
+# leaking into the tail of a manufacturer value
+_RE_SDS_HEADER_MENTION = re.compile(r'\b(?:sds|safety\s+data\s+sheet)\b')
+_RE_PRODUCT_LABEL_TAIL = re.compile(r'\b(Product\s+Name|Trade\s+name)\b', re.IGNORECASE)
+
 
 def is_noise_text(text: str) -> bool:
     """Check if text is likely noise that shouldn't be extracted as field values."""
@@ -126,48 +337,18 @@ def is_noise_text(text: str) -> bool:
         return True
 
     # Allow short numeric values like "9" for DG class
-    if len(text) < 2 and not re.match(r"^\d(?:\.\d)?$", text):
+    if len(text) < 2 and not _RE_SHORT_DG_CLASS.match(text):
         return True
 
-    # Specific noise patterns found in test results
-    noise_patterns = [
-        r'^MSDS\s+Date$',
-        r'^Alternative\s+number\(s\)$',
-        r'^Facsimile\s+Number$',
-        r'^safety\s+data\s+sheet$',
-        r'^Name$',
-        r'^Registered\s+company\s+name$',
-        r'^\:$',
-        r"^[’'`´]s$",
-        r'^UK,?\s+NPIS.*\d{2,4}\s+\d{2,4}\s+\d{2,4}',
-        r'^Australia\s+-\s+\d{2,4}\s+\d{2,4}\s+\d{2,4}',
-        r'^\d{2,4}[-\s]\d{2,4}[-\s]\d{2,4}',
-        r'^Emergency\s+telephone',
-        r'^Contact\s+details',
-        r'^Details\s+of\s+the\s+supplier$',
-        r'^Telephone',
-        r'^Phone',
-        r'^Fax',
-        r'^Email',
-        r'^Address',
-        r'^Website',
-        r'^Emergency\s+Telephone\s+Number$',
-        r'^Company[:.]?\s*$',
-        r'^Company\s+No\.?[:.]?\s*$',
-        r'^Other\s+Name\(s\)$',
-        r'^Formulation\s+#$',
-        r'^Registration\s+no\.?\s*–?\s*US:?\s*$',
-        r'^Group$',
-        r'^Synonyms',
-        r'^Product\s+Code',
-        r'^HS\s+Code',
-        r'^-\s*-$'
-    ]
+    # Most real values start with a character no noise pattern can; skip the regex for them
+    first = text[0].lower()
+    if first not in _NOISE_FIRST_CHARS and not first.isdecimal():
+        return False
 
-    for pattern in noise_patterns:
-        if re.match(pattern, text, re.IGNORECASE):
-            logger.debug("Rejecting noise text: '%s' (matched: %s)", text, pattern)
-            return True
+    m = _RE_NOISE.match(text)
+    if m:
+        logger.debug("Rejecting noise text: '%s' (matched: %s)", text, _NOISE_PATTERNS[m.lastindex - 1])
+        return True
 
     return False
 
@@ -177,11 +358,12 @@ def dedup_repeated_phrase(value: str) -> str:
     if not value:
         return value
     # Trim excessive whitespace
-    cleaned = re.sub(r"\s+", " ", value).strip()
-    # If the whole phrase is repeated twice, collapse
-    m = re.match(r"^(?P<p>.+?)\s+(?P=p)$", cleaned)
-    if m:
-        return m.group('p')
+    cleaned = " ".join(value.split())
+    # If the whole phrase is repeated twice, collapse. With whitespace collapsed to single
+    # spaces the only possible split is at the middle, so compare the halves directly.
+    half, odd = divmod(len(cleaned), 2)
+    if odd and half and cleaned[half] == " " and cleaned[:half] == cleaned[half + 1:]:
+        return cleaned[:half]
     return cleaned
 
 
@@ -189,17 +371,7 @@ def strip_leading_label_prefix(value: str) -> str:
     """Remove leading field labels that may have leaked into values."""
     if not value:
         return value
-    patterns = [
-        r"^(?:product\s+identifier)\s*[:\-]?\s*",
-        r"^(?:product\s+name)\s*[:\-]?\s*",
-        r"^(?:trade\s+name)\s*[:\-]?\s*",
-        r"^(?:commercial\s+product\s+name)\s*[:\-]?\s*",
-        r"^(?:manufacturer|supplier\s+name|supplier|company\s+name\s+of\s+supplier|producer|company\s+name|registered\s+company\s+name|distributor)\s*[:\-]?\s*",
-    ]
-    out = value
-    for pat in patterns:
-        out = re.sub(pat, "", out, flags=re.IGNORECASE).strip()
-    return out
+    return _RE_LEADING_LABELS.sub("", value, count=1).strip()
 
 
 def validate_dangerous_goods_class(value: str) -> bool:
@@ -210,55 +382,145 @@ def validate_dangerous_goods_class(value: str) -> bool:
     value = value.strip()
     
     # Valid class patterns: 1, 1.1, 2.1, etc.
-    if re.match(r'^[1-9](?:\.[1-9])?$', value):
+    if _RE_DG_CLASS.match(value):
         return True
     
     # Valid N/A responses
-    na_patterns = [
-        r'^not?\s+regulated',
-        r'^not?\s+applicable', 
-        r'^none$',
-        r'^n/?a$',
-        r'^not\s+a\s+dangerous\s+good',
-        r'^not\s+subject\s+to',
-    ]
-    
-    for pattern in na_patterns:
-        if re.match(pattern, value, re.IGNORECASE):
-            return True
+    if value.lower() in _DG_NA_LITERALS or _RE_DG_NA.match(value):
+        return True
     
     # Reject invalid values like "14.5", "1950"
-    logger.debug(f"Rejecting invalid DG class: '{value}'")
+    logger.debug("Rejecting invalid DG class: '%s'", value)
     return False
 
 
+# PyMuPDF text is regrouped into lines the way pdfplumber's extract_text() does it (its default
+# 3pt tolerances): the label/value heuristics below were tuned on pdfplumber's line layout.
+_LINE_TOLERANCE = 3
+_LIGATURES = {"ﬀ": "ff", "ﬃ": "ffi", "ﬄ": "ffl", "ﬁ": "fi", "ﬂ": "fl", "ﬆ": "st", "ﬅ": "st"}
+_PYMUPDF_CHAR_FLAGS = (
+    fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_MEDIABOX_CLIP
+    | fitz.TEXT_INHIBIT_SPACES | fitz.TEXT_IGNORE_ACTUALTEXT
+) if fitz else 0
+
+
+def _cluster_by(objs: list, key, tolerance: float) -> list:
+    """Group objects whose key values chain together within ``tolerance``, in key order."""
+    cluster_ids = {}
+    cluster = -1
+    last = None
+    for value in sorted({key(o) for o in objs}):
+        if last is None or value > last + tolerance:
+            cluster += 1
+        cluster_ids[value] = cluster
+        last = value
+
+    def cluster_of(o):
+        return cluster_ids[key(o)]
+
+    return [list(group) for _, group in itertools.groupby(sorted(objs, key=cluster_of), key=cluster_of)]
+
+
+def _pymupdf_page_text(page) -> str:
+    """Extract one page with PyMuPDF, assembling words and lines like pdfplumber's extract_text()."""
+    # (upright, text, x0, x1, top) per character, in content order
+    chars = []
+    textpage = page.get_textpage(flags=_PYMUPDF_CHAR_FLAGS)
+    for block in textpage.extractRAWDICT()["blocks"]:
+        for line in block.get("lines", ()):
+            upright = line["dir"][0] > 0 and abs(line["dir"][1]) < 1e-6
+            for span in line["spans"]:
+                for ch in span["chars"]:
+                    x0, top, x1, _ = ch["bbox"]
+                    chars.append((upright, ch["c"], x0, x1, top))
+
+    tol = _LINE_TOLERANCE
+    words = []  # (text, top)
+    for _, run in itertools.groupby(chars, key=itemgetter(0)):
+        for line_chars in _cluster_by(list(run), itemgetter(4), tol):
+            line_chars.sort(key=itemgetter(2, 4))
+            word = []
+            for ch in line_chars:
+                if ch[1].isspace():
+                    if word:
+                        words.append(word)
+                    word = []
+                    continue
+                if word:
+                    prev = word[-1]
+                    if ch[2] < prev[2] or ch[2] > prev[3] + tol or abs(ch[4] - prev[4]) > tol:
+                        words.append(word)
+                        word = []
+                word.append(ch)
+            if word:
+                words.append(word)
+
+    word_tuples = [("".join(_LIGATURES.get(c[1], c[1]) for c in w), min(c[4] for c in w)) for w in words]
+    lines = _cluster_by(word_tuples, itemgetter(1), tol)
+    return "\n".join(" ".join(text for text, _ in line) for line in lines)
+
+
+def _ocr_images(images: list) -> list:
+    """OCR page images in page order.
+
+    Prefers the process-wide tesserocr API shared with modules.text_extractor, which recognises
+    pages one at a time; the pytesseract fallback runs one process per page, up to OCR_WORKERS
+    at a time. Both engines use the config OCR settings.
+    """
+    if tesserocr_ready() and images:
+        try:
+            texts = [tesserocr_ocr(image) for image in images]
+            if None not in texts:
+                return texts
+        except Exception as e:
+            logger.warning(f"tesserocr OCR failed, using pytesseract: {e}")
+    ocr_page = functools.partial(pytesseract.image_to_string, config=OCR_TESSERACT_CONFIG)
+    if len(images) <= 1 or OCR_WORKERS <= 1:
+        return [ocr_page(image) for image in images]
+    # Each call blocks on its own tesseract process, so threads run the pages in parallel
+    with ThreadPoolExecutor(max_workers=min(OCR_WORKERS, len(images))) as executor:
+        return list(executor.map(ocr_page, images))
+
+
+def _join_pages(page_texts, sep: str = "") -> str:
+    """Join page texts, stopping after the page that takes the total past MAX_TEXT_CHARS.
+
+    ``page_texts`` may be a generator, so the remaining pages are not extracted at all.
+    """
+    parts = []
+    total = 0
+    for page_text in page_texts:
+        parts.append(page_text)
+        total += len(page_text)
+        if total > MAX_TEXT_CHARS:
+            logger.warning(f"Text extraction stopped after {len(parts)} page(s): over {MAX_TEXT_CHARS} chars")
+            break
+    return sep.join(parts)
+
+
 def extract_text_from_pdf(pdf_path: Path) -> str:
     """Extract text using available PDF libraries, preferring the most complete output."""
-
     text = ""
 
-    if PDFPLUMBER_AVAILABLE and pdfplumber:
+    if PYMUPDF_AVAILABLE and fitz:
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
+            with fitz.open(str(pdf_path)) as doc:
+                text = _join_pages(_pymupdf_page_text(page) for page in doc)
             if text.strip():
-                logger.info(f"Extracted {len(text)} chars using pdfplumber")
+                logger.info(f"Extracted {len(text)} chars using PyMuPDF")
                 return text
         except Exception as e:
-            logger.warning(f"pdfplumber failed: {e}")
+            logger.warning(f"PyMuPDF failed: {e}")
 
-    if PYMUPDF_AVAILABLE and fitz:
+    if PDFPLUMBER_AVAILABLE and pdfplumber:
         try:
-            doc = fitz.open(str(pdf_path))
-            for page in doc:
-                text += page.get_text()  # type: ignore
-            doc.close()
+            with pdfplumber.open(pdf_path) as pdf:
+                text = _join_pages(page.extract_text() or "" for page in pdf.pages)
             if text.strip():
-                logger.info(f"Extracted {len(text)} chars using PyMuPDF")
+                logger.info(f"Extracted {len(text)} chars using pdfplumber")
                 return text
         except Exception as e:
-            logger.warning(f"PyMuPDF failed: {e}")
+            logger.warning(f"pdfplumber failed: {e}")
 
     if PDFMINER_AVAILABLE and pdfminer_extract:
         try:
@@ -272,9 +534,10 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
 
     if OCR_AVAILABLE and convert_from_path and pytesseract:
         try:
-            images = convert_from_path(str(pdf_path))
-            for image in images:
-                text += pytesseract.image_to_string(image)
+            # Grayscale at OCR_DPI: a third of the RGB pixel data for the same OCR accuracy;
+            # pdftoppm rasterises page ranges in parallel
+            images = convert_from_path(str(pdf_path), dpi=OCR_DPI, grayscale=True, thread_count=OCR_WORKERS)
+            text += _join_pages(_ocr_images(images))
             if text.strip():
                 logger.info(f"Extracted {len(text)} chars using OCR")
                 return text
@@ -286,22 +549,17 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
     if PYMUPDF_AVAILABLE and OCR_AVAILABLE and pytesseract and PIL_AVAILABLE and fitz and Image:
         try:
             doc = fitz.open(str(pdf_path))  # type: ignore
-            ocr_text_parts = []
+            images = []
             # Render each page to a high-resolution image for better OCR accuracy
             # Use a zoom matrix (~200 DPI equivalent)
             zoom = 2.0
             mat = fitz.Matrix(zoom, zoom)  # type: ignore
             for page in doc:  # type: ignore
-                pix = page.get_pixmap(matrix=mat, alpha=False)
-                # Convert pixmap to PIL Image
-                mode = "RGB" if pix.n >= 3 else "L"
-                img = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-                # Optional light preprocessing: ensure grayscale to reduce noise
-                if mode != "L":
-                    img = img.convert("L")
-                ocr_text_parts.append(pytesseract.image_to_string(img))
+                # Render straight to one gray channel rather than RGB converted afterwards
+                pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+                images.append(Image.frombytes("L", [pix.width, pix.height], pix.samples))
             doc.close()
-            ocr_text = "\n".join(ocr_text_parts).strip()
+            ocr_text = _join_pages(_ocr_images(images), "\n").strip()
             if ocr_text:
                 logger.info(f"Extracted {len(ocr_text)} chars using PyMuPDF OCR fallback")
                 return ocr_text
@@ -312,8 +570,129 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
     return ""
 
 
+def _sections_located(text: str, needed: Tuple[int, ...]) -> bool:
+    """True once ``text`` holds the header of every needed section and the header that ends it."""
+    index = _index_sections(text)
+    for section_num in needed:
+        bounds = index.get(section_num)
+        # The section must be closed by a later header, and clear get_section's size guard
+        if not bounds or bounds[1] == len(text) or len(text[bounds[0]:bounds[1]].strip()) < 30:
+            return False
+    return True
+
+
+def _header_tail(text: str) -> str:
+    """Suffix of ``text`` from the start of the line holding its last word character.
+
+    Header matches whose number lies before this line cannot change when text is appended,
+    so only the tail plus new text has to be scanned for headers that could complete a section.
+    """
+    i = len(text) - 1
+    while i >= 0 and not (text[i].isalnum() or text[i] == '_'):
+        i -= 1
+    if i < 0:
+        return text
+    return text[text.rfind('\n', 0, i) + 1:]
+
+
+def _may_complete_sections(tail: str, needed: Tuple[int, ...]) -> bool:
+    """Whether ``tail`` holds a header that could open a needed section or close one."""
+    if _RE_NEXT_SECTION.search(tail):
+        return True
+    return any(int(m.group(3)) in needed for m in _RE_HEADER_CANDIDATE.finditer(tail))
+
+
+def extract_until_sections(pdf_path: Path, needed: Tuple[int, ...] = (1, 14)) -> Tuple[str, bool]:
+    """Extract page by page and stop one page after all ``needed`` sections are complete.
+
+    Returns ``(text, partial)``; ``partial`` is True when trailing pages were skipped. Falls back
+    to the full extract_text_from_pdf chain when PyMuPDF is unavailable or finds no text.
+    """
+    if PYMUPDF_AVAILABLE and fitz:
+        try:
+            parts = []
+            total = 0
+            located = False
+            tail = ""
+            with fitz.open(str(pdf_path)) as doc:
+                for page in doc:
+                    parts.append(_pymupdf_page_text(page))
+                    total += len(parts[-1])
+                    if located:
+                        # One page past the sections, so no header match ends at a page cut
+                        break
+                    if total > MAX_TEXT_CHARS:
+                        logger.warning(f"Text extraction stopped after {len(parts)} page(s): over {MAX_TEXT_CHARS} chars")
+                        break
+                    # Re-index the accumulated text only when the new page brings a header that
+                    # could complete a section, so long documents aren't rescanned page after page
+                    tail += parts[-1]
+                    if _may_complete_sections(tail, needed):
+                        located = _sections_located("".join(parts), needed)
+                    tail = _header_tail(tail)
+                partial = len(parts) < doc.page_count
+            text = "".join(parts)
+            if text.strip():
+                logger.info(f"Extracted {len(text)} chars from {len(parts)} page(s) using PyMuPDF")
+                return text, partial
+        except Exception as e:
+            logger.warning(f"PyMuPDF page-by-page extraction failed: {e}")
+
+    return extract_text_from_pdf(pdf_path), False
+
+
+@functools.lru_cache(maxsize=None)
+def _loose_section_pattern(section_num: int) -> Pattern:
+    """Compiled fallback pattern used by get_section when no strict header is usable."""
+    loose = rf'(?:^|\n)\s*(?:section\s*)?{section_num}(?!\s*/)(?:\s|:|\.|-).*?' \
+            rf'(?=\n\s*(?:section\s*)?\d{{1,2}}(?!\.\d)(?!\s*/)(?:\s|:|\.|-)|$)'
+    return re.compile(loose, re.IGNORECASE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=2)
+def _index_sections(text: str) -> Dict[int, Tuple[int, int]]:
+    """Map each section number to the (start, end) of its strict header match in one pass.
+
+    ``start`` is the first line start whose header qualifies for that number; ``end`` is
+    the next section header after the header line. Memoised per text, so every
+    get_section call on a document shares a single scan.
+    """
+    next_starts = [m.start() for m in _RE_NEXT_SECTION.finditer(text)]
+    index: Dict[int, Tuple[int, int]] = {}
+    for m in _RE_HEADER_CANDIDATE.finditer(text):
+        leading, digits, punct = m.group(2, 3, 4)
+        number = int(digits)
+        if number in index or digits != str(number):
+            continue
+        if number not in _RELAXED_HEADER_SECTIONS and (not punct or (leading and not leading.isspace())):
+            continue
+        search_from = m.end(1)
+        # A header on the very next line ends the section at the newline, as a search
+        # starting at the end of the header line would
+        i = bisect.bisect_right(next_starts, search_from)
+        if i == len(next_starts):
+            end = len(text)
+        elif next_starts[i] == search_from + 1:
+            end = search_from
+        else:
+            end = next_starts[i]
+        index[number] = (m.start(), end)
+    return index
+
+
+@functools.lru_cache(maxsize=256)
+def _label_patterns(label: str) -> Tuple[Pattern, Pattern, Pattern]:
+    """Compiled (value on the line, inline "label: value", label-only line) patterns for a field label."""
+    return (
+        re.compile(rf'^{label}\s*[:\-]?\s*(.+)$', re.IGNORECASE),
+        re.compile(rf'{label}\s*[:\-]\s*(.+)', re.IGNORECASE),
+        re.compile(rf'^{label}\s*[:\-]?\s*$', re.IGNORECASE),
+    )
+
+
+@functools.lru_cache(maxsize=4)
 def get_section(text: str, section_num: int) -> str:
-    """Extract a specific section from SDS text with robust boundaries.
+    """Extract a specific section from SDS text with robust boundaries (memoised per text and section).
 
     Strategy:
     - Prefer clear section headers that start a line and are either "Section N"
@@ -323,39 +702,65 @@ def get_section(text: str, section_num: int) -> str:
     - If strict matching fails (rare layouts), fall back to a looser regex similar
       to previous logic.
     """
-    # Build start pattern
-    if section_num == 1:
-        # Identification can be OCR-mangled; allow leading bullets/symbols and rely on section number
-        start_pat = rf'^\W*(?:section\s*)?1\s*[:\.-]?\s.*$'
-    elif section_num == 14:
-        # Relaxed: allow leading bullets/symbols
-        start_pat = rf'^\W*(?:section\s*)?14\s*[:\.-]?\s.*$'
-    else:
-        # Require punctuation after number to avoid addresses like "2 Fred ..."
-        start_pat = rf'^\s*(?:section\s*)?{section_num}\s*[:\.-]\s.*$'
-
-    # A header for any subsequent section
-    next_pat = r'^\W*(?:section\s*)?\d{1,2}\s*[:\.-]\s'
-
-    start_m = re.search(start_pat, text, re.IGNORECASE | re.MULTILINE)
-    if start_m:
-        # Begin right after the matched header line to avoid re-matching the same header
-        start = start_m.start()
-        search_from = start_m.end()
-        next_m = re.search(next_pat, text[search_from:], re.IGNORECASE | re.MULTILINE)
-        end = (search_from + next_m.start()) if next_m else len(text)
+    bounds = _index_sections(text).get(section_num)
+    if bounds:
+        start, end = bounds
         section = text[start:end]
         # Guard against pathological tiny matches from OCR noise
         if len(section.strip()) >= 30:
             return section
 
     # Fallback (looser) single pass, keeps prior behavior if strict fails
-    loose = rf'(?:^|\n)\s*(?:section\s*)?{section_num}(?!\s*/)(?:\s|:|\.|-).*?' \
-            rf'(?=\n\s*(?:section\s*)?\d{{1,2}}(?!\.\d)(?!\s*/)(?:\s|:|\.|-)|$)'
-    m2 = re.search(loose, text, re.IGNORECASE | re.DOTALL)
+    m2 = _loose_section_pattern(section_num).search(text)
     return m2.group(0) if m2 else ""
 
 
+@functools.lru_cache(maxsize=64)
+def _any_label_pattern(field_labels: Tuple[str, ...]) -> Pattern:
+    """Compiled alternation finding any of ``field_labels`` anywhere in a line."""
+    return re.compile('|'.join(f'(?:{label})' for label in field_labels), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4)
+def _split_lines(text: str) -> Tuple[str, ...]:
+    """Stripped ``text.split('\n')``, memoised: Sections 1 and 14 are scanned by several extractors."""
+    return tuple(line.strip() for line in text.split('\n'))
+
+
+def _head_lines(text: str, count: int) -> List[str]:
+    """First ``count`` lines of ``text`` as ``text.splitlines()`` gives them, splitting only a prefix."""
+    size = 4096
+    while size < len(text):
+        lines = text[:size].splitlines()
+        # A further line after them means the first ``count`` end inside the prefix
+        if len(lines) > count:
+            return lines[:count]
+        size *= 4
+    return text.splitlines()[:count]
+
+
+@functools.lru_cache(maxsize=1024)
+def _next_line_value(candidate: str) -> str:
+    """Cleaned value of a (stripped) line following a label-only line, or '' if it is noise.
+
+    Memoised: the same lines are revisited for every label-only match and every field
+    looked up in a section.
+    """
+    value = _RE_TRAILING_SEPARATOR.sub('', candidate)
+    value = _RE_CONTACT_TAIL.sub('', value)
+    other_match = _RE_COMMON_FIELD_LABEL.search(value)
+    if other_match:
+        value = value[:other_match.start()].strip()
+    value = _RE_TRAILING_CODE.sub('', value).strip()
+
+    # Remove leading possessive artifacts like various apostrophes followed by s
+    value = _RE_POSSESSIVE_PREFIX.sub("", value)
+
+    if value and not is_noise_text(value):
+        return value
+    return ''
+
+
 def extract_field_value(text: str, field_labels: list, section_text: str = None) -> Optional[str]:
     """Extract field value following labels, with improved validation."""
     
@@ -365,65 +770,53 @@ def extract_field_value(text: str, field_labels: list, section_text: str = None)
     if not search_text:
         return None
     
-    lines = search_text.split('\n')
+    lines = _split_lines(search_text)
+    label_patterns = [_label_patterns(label) for label in field_labels]
+    any_label_re = _any_label_pattern(tuple(field_labels))
+    is_company_field = any('manufacturer' in str(label).lower() or 'supplier' in str(label).lower() for label in field_labels)
     
     for i, line in enumerate(lines):
-        line = line.strip()
         if not line:
             continue
+        # Every per-label pattern below needs the label somewhere in the line
+        if not any_label_re.search(line):
+            continue
             
-        for label in field_labels:
-            pattern = rf'^{label}\s*[:\-]?\s*(.+)$'
-            match = re.search(pattern, line, re.IGNORECASE)
+        for value_re, inline_re, label_only_re in label_patterns:
+            match = value_re.search(line)
             if not match:
-                pattern = rf'{label}\s*[:\-]\s*(.+)'
-                match = re.search(pattern, line, re.IGNORECASE)
+                match = inline_re.search(line)
             if match:
                 value = match.group(1).strip()
 
                 # Remove leading possessive artifacts like various apostrophes followed by s
-                value = re.sub(r"^[’'`´]+s\b\s*", "", value)
+                value = _RE_POSSESSIVE_PREFIX.sub("", value)
 
-                value = re.sub(r'\s*[:\-]\s*$', '', value)
-                value = re.sub(r'\s+(Tel|Phone|Fax|Email|Emergency).*$', '', value, re.IGNORECASE)
+                value = _RE_TRAILING_SEPARATOR.sub('', value)
+                value = _RE_CONTACT_TAIL.sub('', value)
 
-                for other in COMMON_FIELD_LABELS:
-                    other_match = re.search(other + r'\s*[:\-]?', value, re.IGNORECASE)
-                    if other_match:
-                        value = value[:other_match.start()].strip()
-                        break
+                other_match = _RE_COMMON_FIELD_LABEL.search(value)
+                if other_match:
+                    value = value[:other_match.start()].strip()
 
-                value = re.sub(r'\b[A-Z0-9]{2,}[/A-Z0-9\-]*$', '', value).strip()
+                value = _RE_TRAILING_CODE.sub('', value).strip()
 
-                if any('manufacturer' in str(label).lower() or 'supplier' in str(label).lower() for label in field_labels):
-                    if re.match(r'^of\s+the\s+safety\s+data\s+sheet\s*$', value, re.IGNORECASE):
+                if is_company_field:
+                    if _RE_OF_THE_SDS.match(value):
                         continue
 
                 if value and not is_noise_text(value):
                     return value
             
             # Pattern: Label on one line, value on next
-            if re.match(rf'^{label}\s*[:\-]?\s*$', line, re.IGNORECASE):
+            if label_only_re.match(line):
                 for j in range(i + 1, min(i + 6, len(lines))):
-                    candidate = lines[j].strip()
-                    if not candidate or candidate == ':':
-                        continue
-                    if candidate.startswith(':'):
+                    candidate = lines[j]
+                    # Blank lines and ':' continuations are rejected before any regex runs
+                    if not candidate or candidate[0] == ':':
                         continue
-
-                    value = re.sub(r'\s*[:\-]\s*$', '', candidate)
-                    value = re.sub(r'\s+(Tel|Phone|Fax|Email|Emergency).*$', '', value, re.IGNORECASE)
-                    for other in COMMON_FIELD_LABELS:
-                        other_match = re.search(other + r'\s*[:\-]?', value, re.IGNORECASE)
-                        if other_match:
-                            value = value[:other_match.start()].strip()
-                            break
-                    value = re.sub(r'\b[A-Z0-9]{2,}[/A-Z0-9\-]*$', '', value).strip()
-
-                    # Remove leading possessive artifacts like various apostrophes followed by s
-                    value = re.sub(r"^[’'`´]+s\b\s*", "", value)
-
-                    if value and not is_noise_text(value):
+                    value = _next_line_value(candidate)
+                    if value:
                         return value
     
     return None
@@ -434,22 +827,22 @@ def extract_dg_class_from_table(section_text: str) -> Optional[str]:
     if not section_text:
         return None
 
-    lines = [line.strip() for line in section_text.splitlines() if line.strip()]
+    lines = [line for line in map(str.strip, section_text.splitlines()) if line]
 
     # Detect presence of modal headers (ADG IMDG IATA)
-    has_modal_headers = any(re.search(r'\bADG\b.*\bIMDG\b.*\bIATA\b', l, re.IGNORECASE) for l in lines)
+    has_modal_headers = any(_RE_MODAL_HEADERS.search(l) for l in lines)
 
     # Prefer explicit 'Transport hazard class(es)' rows and choose ADG if multiple present
     for i, line in enumerate(lines):
-        if re.search(r'Transport\s+hazard', line, re.IGNORECASE):
+        if _RE_TRANSPORT_HAZARD.search(line):
             # Combine with next line to catch split 'class(es)'
             combined = line
             if i + 1 < len(lines):
                 combined += ' ' + lines[i + 1]
             # Remove the label portion
-            combined_tail = re.sub(r'^.*?Transport\s+hazard\s*(?:class(?:\(es\))?)?\s*', '', combined, flags=re.IGNORECASE)
+            combined_tail = _RE_TRANSPORT_HAZARD_PREFIX.sub('', combined)
             # Extract tokens and validate
-            tokens = [t.strip(',;') for t in re.split(r'\s+|\|', combined_tail) if t.strip()]
+            tokens = [t.strip(',;') for t in combined_tail.replace('|', ' ').split()]
             classes = [t for t in tokens if validate_dangerous_goods_class(t)]
             if classes:
                 # If table with ADG/IMDG/IATA present, the first class corresponds to ADG
@@ -459,9 +852,9 @@ def extract_dg_class_from_table(section_text: str) -> Optional[str]:
 
     # Fallback: look for generic 'DG Class' or 'Class:' in a nearby segment
     for idx, line in enumerate(lines):
-        if re.search(r'DG\s*Class|Class\s*:', line, re.IGNORECASE):
+        if _RE_DG_CLASS_LABEL.search(line):
             for line2 in lines[idx: idx + 6]:
-                tokens = re.split(r'\s+|\|', line2)
+                tokens = line2.replace('|', ' ').split()
                 for token in tokens:
                     token = token.strip(',;')
                     if validate_dangerous_goods_class(token):
@@ -471,20 +864,25 @@ def extract_dg_class_from_table(section_text: str) -> Optional[str]:
     return None
 
 
+def _is_packing_group_value(token: str) -> bool:
+    return token.lower() in _PACKING_GROUP_LITERALS or bool(VALID_PACKING_GROUPS.match(token))
+
+
 def extract_packing_group_from_table(section_text: str) -> Optional[str]:
     """Extract packing group from tabular layouts."""
-    if not section_text:
+    # One search rules out sections that never mention a packing group
+    if not section_text or not _RE_PACKING_GROUP_LABEL.search(section_text):
         return None
 
     lines = section_text.splitlines()
     
     # Look for packing group in table format
     for i, line in enumerate(lines):
-        if re.search(r'packing\s+group', line, re.IGNORECASE):
+        if _RE_PACKING_GROUP_LABEL.search(line):
             # Prefer values on the same line after the label; pick ADG (first) if multiple present
-            tail = re.sub(r'^.*?packing\s+group\s*', '', line, flags=re.IGNORECASE)
-            tokens = [t.strip(',;') for t in re.split(r'\s+|\|', tail) if t.strip()]
-            vals = [t for t in tokens if re.match(r'^(I{1,3}|IV?|N\.?/?A\.?|None|Not\s+(?:applicable|required|assigned)|Not\s+subject)$', t, re.IGNORECASE)]
+            tail = _RE_PACKING_GROUP_PREFIX.sub('', line)
+            tokens = [t.strip(',;') for t in tail.replace('|', ' ').split()]
+            vals = [t for t in tokens if _is_packing_group_value(t)]
             if vals:
                 chosen = vals[0]
                 logger.info(f"[SDS_EXTRACTOR] Packing group from header line: '{chosen}'")
@@ -495,9 +893,9 @@ def extract_packing_group_from_table(section_text: str) -> Optional[str]:
                 table_line = lines[j].strip()
                 if not table_line:
                     continue
-                cells = [c.strip(',;') for c in re.split(r'\s{2,}|\t|\|', table_line) if c.strip()]
+                cells = [c.strip(',;') for c in _RE_TABLE_CELL_SPLIT.split(table_line) if c.strip()]
                 for cell in cells:
-                    if re.match(r'^(I{1,3}|IV?|N\.?/?A\.?|None|Not\s+(?:applicable|required|assigned)|Not\s+subject)$', cell, re.IGNORECASE):
+                    if _is_packing_group_value(cell):
                         logger.info(f"[SDS_EXTRACTOR] Packing group from table row: '{cell}'")
                         return cell
     
@@ -526,11 +924,11 @@ def extract_product_name(section1_text: str) -> Optional[str]:
     result = extract_field_value("", labels, section1_text)
     if result and not is_noise_text(result):
         # Additional validation - reject obvious labels and company suffixes
-        if not re.match(r'^(Pty\s+Ltd|Ltd|Inc\.?|Corp\.?|Company|Alternative\s+number\(s\)|Other\s+Name\(s\)|Formulation\s+#|Registration\s+no\.?\s*–?\s*US:?|Group)$', result, re.IGNORECASE):
+        if not _RE_PRODUCT_NAME_REJECT.match(result):
             # Reject transport/composition phrases sometimes picked up as values
             lowered = result.lower()
             # Also reject if the result is itself a generic label like 'Product Identifier'
-            if re.fullmatch(r'(product\s+identifier|product\s+name|trade\s+name|commercial\s+product\s+name)', lowered):
+            if _RE_PRODUCT_LABEL_ONLY.fullmatch(lowered):
                 pass
             elif any(tok in lowered for tok in ['proper shipping name', 'chemical formula', 'un number']) or lowered in ['not applicable', 'n/a', 'na']:
                 pass
@@ -541,40 +939,39 @@ def extract_product_name(section1_text: str) -> Optional[str]:
                 return cleaned or None
     
     # Strategy 2: Look for meaningful product-like text in early lines (RESTORE WORKING LOGIC)
-    lines = section1_text.split('\n')
+    lines = _split_lines(section1_text)
     
     for line in lines[:15]:  # Check first 15 lines
-        line = line.strip()
         if not line:
             continue
             
         # Skip obvious headers and labels
-        if re.match(r'^\d+\.|\bsection\b|\bidentification\b', line, re.IGNORECASE):
+        if _RE_LINE_HEADER.match(line):
             continue
-        if any(x in line.lower() for x in ['supplier', 'emergency', 'telephone', 'contact', 'details']):
+        lowered = line.lower()
+        if _RE_PN_CONTACT_WORDS.search(lowered):
             continue
-        if re.match(r'^synonym\(s\)', line, re.IGNORECASE):
+        if _RE_SYNONYMS_LINE.match(line):
             continue
-        if re.match(r'^(use\(s\)|use of the substance|recommended use)', line, re.IGNORECASE):
+        if _RE_USE_LINE.match(line):
             continue
-        if re.match(r'^(msds|sds)\s+date\b', line, re.IGNORECASE):
+        if _RE_SDS_DATE_LINE.match(line):
             continue
         if is_noise_text(line):
             continue
         
         # Check if line looks like a product name (has alphanumeric content, reasonable length)
-        if re.search(r'[A-Za-z0-9]', line) and 3 <= len(line) <= 100:
+        if _RE_ALNUM.search(line) and 3 <= len(line) <= 100:
             # Avoid lines that are obviously not product names
-            if not re.search(r'@|www\.|\.com|\.org', line, re.IGNORECASE):
-                if not re.match(r'^[:\-\s]+$', line):
+            if not _RE_WEB_OR_EMAIL.search(line):
+                if not _RE_PUNCT_ONLY.match(line):
                     # Additional check to avoid obvious label patterns
-                    if not re.match(r'^(Alternative\s+number\(s\)|Other\s+Name\(s\)|Formulation\s+#|Registration\s+no\.?\s*–?\s*US:?|Group)$', line, re.IGNORECASE):
+                    if not _RE_LABEL_LINE.match(line):
                         # Skip common transport-related labels
-                        lowered = line.lower()
-                        if any(tok in lowered for tok in ['proper shipping name', 'shipping name', 'un number', 'transport', 'hazchem', 'epg', 'chemical formula', 'not applicable']):
+                        if _RE_PN_TRANSPORT_WORDS.search(lowered):
                             continue
                         # Skip date headers that sometimes appear as standalone lines
-                        if re.match(r'^(msds\s+date|date\s+of\s+issue|revision\s+date|version\s+date)\b', lowered, re.IGNORECASE):
+                        if _RE_DATE_HEADER_LINE.match(lowered):
                             continue
                         candidate = strip_leading_label_prefix(line)
                         candidate = dedup_repeated_phrase(candidate)
@@ -610,27 +1007,23 @@ def extract_manufacturer(section1_text: str) -> Optional[str]:
     result = extract_field_value("", labels, section1_text)
     if result and not is_noise_text(result):
         # Additional validation - reject obvious noise fragments
-        if not re.match(r'^(of\s+the\s+safety\s+data\s+sheet|Emergency\s+Telephone\s+Number|Company[:.]?\s*$|Company\s+No\.?[:.]?\s*$)$', result, re.IGNORECASE):
+        if not _RE_MANUFACTURER_REJECT.match(result):
             cleaned = strip_leading_label_prefix(result)
             cleaned = dedup_repeated_phrase(cleaned)
             logger.info(f"[SDS_EXTRACTOR] Manufacturer from label: '{cleaned}'")
             return cleaned or None
     
     # Strategy 2: Look in "Details of the supplier" section (RESTORE WORKING LOGIC)
-    supplier_match = re.search(r'Details\s+of\s+the\s+supplier[^\n]*\n(.{1,500}?)(?:\n\s*[A-Z][a-z]|\n\s*\d|$)', 
-                              section1_text, re.IGNORECASE | re.DOTALL)
-    if supplier_match:
-        supplier_section = supplier_match.group(1)
-        lines = supplier_section.split('\n')
-        
+    lines = _supplier_details_lines(section1_text)
+    if lines:
         for line in lines:
             line = line.strip()
             if line and not is_noise_text(line) and len(line) > 3:
                 # Skip phone numbers and obvious noise
-                if not re.search(r'\b\d{2,4}[-\s]\d{2,4}[-\s]\d{2,4}\b', line):
-                    if not re.match(r'^(Emergency\s+Telephone\s+Number|Company[:.]?\s*$)', line, re.IGNORECASE):
+                if not _RE_PHONE_NUMBER.search(line):
+                    if not _RE_SUPPLIER_NOISE_LINE.match(line):
                         # Skip generic SDS headers if they slipped through
-                        if re.search(r'safety\s+data\s+sheet|^section\b|^page\b', line, re.IGNORECASE):
+                        if _RE_SDS_HEADER_LINE.search(line):
                             continue
                         cleaned = strip_leading_label_prefix(line)
                         cleaned = dedup_repeated_phrase(cleaned)
@@ -640,6 +1033,29 @@ def extract_manufacturer(section1_text: str) -> Optional[str]:
     return None
 
 
+def _supplier_details_lines(text: str) -> Optional[list]:
+    """Lines under the first "Details of the supplier" header that is followed by a block.
+
+    The block runs from the line after the header up to the next line that starts with a
+    word or a number (blank and symbol-led lines stay in it), and must fit in 500 chars.
+    Scanned newline by newline, so long sections cost no regex backtracking.
+    """
+    m = _RE_SUPPLIER_DETAILS.search(text)
+    while m:
+        start = m.end()
+        # The block holds at least one character, so its first possible end is start + 1
+        end = text.find('\n', start + 1)
+        while end != -1 and end - start <= _SUPPLIER_BLOCK_MAX_CHARS:
+            if end == len(text) - 1 or _RE_SUPPLIER_BLOCK_END.match(text, end + 1):
+                return text[start:end].split('\n')
+            end = text.find('\n', end + 1)
+        if end == -1 and start < len(text) and len(text) - start <= _SUPPLIER_BLOCK_MAX_CHARS:
+            return text[start:].split('\n')
+        # Headers may wrap ("Details of the\nsupplier"), so retry from the next character
+        m = _RE_SUPPLIER_DETAILS.search(text, m.start() + 1)
+    return None
+
+
 def extract_description(section1_text: str) -> Optional[str]:
     """Extract product description/use information from Section 1."""
     try:
@@ -668,7 +1084,7 @@ def extract_manufacturer_global(full_text: str) -> Optional[str]:
     """
     if not full_text:
         return None
-    head = "\n".join(full_text.splitlines()[:60])
+    head = "\n".join(_head_lines(full_text, 60))
     labels = [
         r'Manufacturer',
         r'Supplier\s+Name',
@@ -687,6 +1103,50 @@ def extract_manufacturer_global(full_text: str) -> Optional[str]:
     return None
 
 
+def _fold_date_text(text: str) -> str:
+    """Lower-case ``text`` for the date label scan, folding the few extra IGNORECASE equivalents."""
+    if any(ch in text for ch in _DATE_CASE_FOLD_CHARS):
+        text = text.translate(_DATE_CASE_FOLD)
+    return text.lower()
+
+
+def _iter_labeled_dates(text: str, folded: str, date_re: Pattern, label_re: Pattern):
+    """Yield the matches ``date_re.finditer(text)`` would, trying ``date_re`` only at label starts.
+
+    ``folded`` is the lower-cased text that ``label_re`` (lower-case, case-sensitive) scans.
+    """
+    if len(folded) != len(text):
+        # Offsets would not line up; scan the original text directly
+        yield from date_re.finditer(text)
+        return
+    pos = 0
+    while True:
+        hit = label_re.search(folded, pos)
+        if not hit:
+            return
+        m = date_re.match(text, hit.start())
+        if m:
+            yield m
+            pos = m.end()
+        else:
+            pos = hit.start() + 1
+
+
+def _date_formats_for(value: str) -> List[str]:
+    """Return the strptime formats that could parse ``value``, in priority order.
+
+    A format is skipped only when it cannot match: one of its separators is missing (format
+    whitespace matches any run of whitespace), or it expects a month name and ``value`` has no
+    letters (or vice versa).
+    """
+    present = {sep for sep in '/-.' if sep in value}
+    if any(ch.isspace() for ch in value):
+        present.add(' ')
+    has_alpha = any(ch.isalpha() for ch in value)
+    return [fmt for fmt, seps, wants_alpha in _STRPTIME_DATE_FORMATS
+            if wants_alpha == has_alpha and seps <= present]
+
+
 def extract_date(text: str) -> Optional[str]:
     """Extract issue/revision date with enhanced patterns and prioritization.
 
@@ -694,20 +1154,13 @@ def extract_date(text: str) -> Optional[str]:
     """
 
     # 0) Fast path: explicitly look for labeled ISO-like dates first (robust for OCR)
-    iso_label = re.search(
-        r'(Issue\s*Date|Revision(?:\s*Date)?|Date\s*of\s*issue|Version\s*date|Date\s*Prepared|Prepared\s*on|Issued)[^\n]{0,60}?(\d{4}-\d{2}-\d{2})',
-        text,
-        re.IGNORECASE,
-    )
+    folded = _fold_date_text(text)
+    iso_label = next(_iter_labeled_dates(text, folded, *_ISO_DATE_PATTERN), None)
     if iso_label:
         return iso_label.group(2)
 
     # 1) Prefer modular labeled extraction (captures and prioritizes by label)
     try:
-        try:
-            from .modules.date_parser import extract_issue_date as mod_extract_issue_date
-        except ImportError:  # pragma: no cover
-            from modules.date_parser import extract_issue_date as mod_extract_issue_date
         labeled = mod_extract_issue_date(text)
         if labeled:
             return labeled
@@ -715,61 +1168,44 @@ def extract_date(text: str) -> Optional[str]:
         pass
 
     # 2) Fallback to explicit labeled regexes (legacy)
-    date_patterns = [
-        # Labeled + various formats, including dd-MMM-YYYY
-        r'(?:Issue\s*Date|Revision(?:\s*Date)?|Date\s*of\s*issue|Version\s*date|Date\s*Prepared|Prepared\s*on|Issued|MSDS\s*Date|SDS\s*Date|Last\s*Updated|Last\s*Revision|Last\s*Revised|Updated\s*on|Last\s*Modified|Effective\s*Date)[^\n]{0,40}?[:\-]?\s*' \
-        r'(\d{1,2}[\-\/\.]+\d{1,2}[\-\/\.]+\d{2,4}|\d{4}-\d{2}-\d{2}|[A-Za-z]+\.?\s+\d{1,2},?\s*\d{4}|\d{1,2}\s+[A-Za-z]+\.?\s+\d{4}|\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4}|[A-Za-z]+\.?\s+\d{4})',
-        r'Revision[:\s]*(\d{4}-\d{2}-\d{2})',
-        r'Revision[:\s]*(\d{1,2}[\-\/]\d{1,2}[\-\/]\d{4})',
-        r'Revision[:\s]*(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})',
-        r'REVISION\s+DATE[:\s]*(\d{1,2}\s+\w+\.?\s+\d{4})',
-        r'REVISION\s+DATE[:\s]*(\d{1,2}[\-\/]\d{1,2}[\-\/]\d{4})',
-        r'REVISION\s+DATE[:\s]*(\d{1,2}[\-\/.][A-Za-z]{3,}\.?[\-\/.]\d{2,4})',
-    ]
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for date_re, label_re in _LEGACY_DATE_PATTERNS:
+        matches = [m.group(1) for m in _iter_labeled_dates(text, folded, date_re, label_re)]
         if matches:
-            try:
-                from datetime import datetime, date
-                # Prefer candidates containing a 4-digit year when available
-                def has_four_digit_year(s: str) -> bool:
-                    return bool(re.search(r"\b\d{4}\b", s))
-                # Normalize to list (re.findall may return tuples when groups present)
-                norm = []
-                for m in matches:
-                    if isinstance(m, tuple):
-                        # pick the last non-empty group (typical date capture)
-                        for part in m[::-1]:
-                            if part:
-                                norm.append(part)
-                                break
-                    else:
-                        norm.append(m)
-                # Stable sort: 4-digit year first
-                ordered = sorted(norm, key=lambda s: (0 if has_four_digit_year(str(s)) else 1))
-                for date_str in ordered:
-                    # Normalize month abbreviations with trailing dot
-                    cleaned = re.sub(r'\b([A-Za-z]{3,})\.', r'\1', date_str)
-                    for fmt in ['%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d', '%d-%m-%Y', '%d.%m.%Y', '%d %b %Y', '%d %B %Y', '%b %d %Y', '%B %d %Y', '%d-%b-%Y', '%d-%b-%y', '%d.%b.%Y', '%d.%b.%y']:
+            # Normalize to list (re.findall may return tuples when groups present)
+            norm = []
+            for m in matches:
+                if isinstance(m, tuple):
+                    # pick the last non-empty group (typical date capture)
+                    for part in m[::-1]:
+                        if part:
+                            norm.append(part)
+                            break
+                else:
+                    norm.append(m)
+            # Stable sort: 4-digit year first
+            ordered = sorted(norm, key=lambda s: (0 if _RE_FOUR_DIGIT_YEAR.search(str(s)) else 1))
+            today = date.today()
+            for date_str in ordered:
+                # Normalize month abbreviations with trailing dot
+                cleaned = _RE_MONTH_ABBREV_DOT.sub(r'\1', date_str)
+                for fmt in _date_formats_for(cleaned):
+                    try:
+                        parsed_date = datetime.strptime(cleaned, fmt).date()
+                        if parsed_date <= today:
+                            return parsed_date.strftime('%Y-%m-%d')
+                    except ValueError:
+                        continue
+                # Fallback: Month Year (no day) -> set day=01
+                m = _RE_MONTH_YEAR.fullmatch(cleaned)
+                if m:
+                    for fmt in _STRPTIME_MONTH_YEAR_FORMATS:
                         try:
-                            parsed_date = datetime.strptime(cleaned, fmt).date()
-                            if parsed_date <= date.today():
+                            dt = datetime.strptime(cleaned, fmt)
+                            parsed_date = date(dt.year, dt.month, 1)
+                            if parsed_date <= today:
                                 return parsed_date.strftime('%Y-%m-%d')
                         except ValueError:
                             continue
-                    # Fallback: Month Year (no day) -> set day=01
-                    m = re.fullmatch(r'([A-Za-z]+)\s+(\d{4})', cleaned)
-                    if m:
-                        for fmt in ['%b %Y', '%B %Y']:
-                            try:
-                                dt = datetime.strptime(cleaned, fmt)
-                                parsed_date = date(dt.year, dt.month, 1)
-                                if parsed_date <= date.today():
-                                    return parsed_date.strftime('%Y-%m-%d')
-                            except ValueError:
-                                continue
-            except ImportError:
-                return norm[0] if norm else None
 
     # 3) Finally, header-based extraction (includes print/printing date variants)
     try:
@@ -782,13 +1218,75 @@ def extract_date(text: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _parser_fingerprint() -> str:
+    """Hash of this package's sources, so cached results are dropped when the parser changes."""
+    digest = hashlib.sha1()
+    package_dir = Path(__file__).resolve().parent
+    for source in sorted([package_dir / 'sds_extractor.py', *(package_dir / 'modules').glob('*.py')]):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def _result_cache_path(path: Path) -> Optional[Path]:
+    """Cache file for ``path``'s content under RESULT_CACHE_DIR, or None when caching is off."""
+    if not RESULT_CACHE_DIR:
+        return None
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return Path(RESULT_CACHE_DIR) / f"{digest.hexdigest()}-{_parser_fingerprint()}.json"
+
+
+def _write_result_cache(cache_path: Path, result: Dict[str, Any]) -> None:
+    """Write ``result`` atomically (temp file + rename), so readers never see a partial file."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 def parse_pdf(path: Path) -> Dict[str, Any]:
-    """Main parsing function that fixes the specific issues found in testing."""
-    
+    """Main parsing function that fixes the specific issues found in testing.
+
+    With ``SDS_CACHE_DIR`` set, results are cached on disk by file content (and parser
+    version), so re-uploads and retries of the same PDF skip extraction entirely.
+    """
+    cache_path = None
+    try:
+        cache_path = _result_cache_path(Path(path))
+        if cache_path and cache_path.is_file():
+            with open(cache_path, encoding='utf-8') as f:
+                result = json.load(f)
+            logger.info(f"Using cached result for {path}")
+            return result
+    except Exception as e:
+        logger.warning(f"Result cache read failed: {e}")
+
+    result = _parse_pdf(path)
+
+    # Failed extractions are not cached, so a later retry can still succeed
+    if cache_path and "error" not in result:
+        try:
+            _write_result_cache(cache_path, result)
+        except Exception as e:
+            logger.warning(f"Result cache write failed: {e}")
+    return result
+
+
+def _parse_pdf(path: Path) -> Dict[str, Any]:
     logger.info(f"Starting to parse: {path}")
     
-    # Extract text
-    text = extract_text_from_pdf(path)
+    # Extract text, stopping once Sections 1 and 14 have been read
+    text, partial = extract_until_sections(path)
+    # Whole-document text, extracted only if a document-wide lookup finds nothing in a partial text
+    full_text = None
     if not text:
         return {
             "error": "Could not extract text from PDF",
@@ -818,22 +1316,21 @@ def parse_pdf(path: Path) -> Dict[str, Any]:
                 "pdfplumber": PDFPLUMBER_AVAILABLE,
                 "pdfminer": PDFMINER_AVAILABLE
             },
-            "extraction_mode": "full"
+            "extraction_mode": "sections" if partial else "full"
         }
     }
     
     # Product name
     product_name = extract_product_name(section1)
-    prefix = '\n'.join(text.splitlines()[:15])
     if not product_name:
-        # Try prefix
-        product_name = extract_product_name(prefix)
+        # Try the first lines of the document, only built when Section 1 yields nothing
+        product_name = extract_product_name('\n'.join(_head_lines(text, 15)))
     # If still missing or looks like an SDS header/date, try global label-based extractor
     sds_header_like = False
     if product_name:
         lowered = str(product_name).lower().strip()
         # Treat lines mentioning SDS or Safety Data Sheet as header-like, regardless of date format
-        if re.search(r'\b(?:sds|safety\s+data\s+sheet)\b', lowered):
+        if _RE_SDS_HEADER_MENTION.search(lowered):
             sds_header_like = True
     if not product_name or sds_header_like:
         try:
@@ -842,28 +1339,28 @@ def parse_pdf(path: Path) -> Dict[str, Any]:
             alt_global = None
         if alt_global:
             product_name = alt_global
-    result['product_name'] = {'value': product_name, 'confidence': 1.0 if product_name else 0.0}
     
     # Manufacturer
     manufacturer = extract_manufacturer(section1)
     if not manufacturer:
         # Fallback to global scan in case supplier/manufacturer details sit outside Section 1
         manufacturer = extract_manufacturer_global(text)
+        if not manufacturer and partial:
+            full_text = extract_text_from_pdf(path)
+            manufacturer = extract_manufacturer_global(full_text)
     # Final cleanup to remove any leaked labels or concatenated fields
     if manufacturer:
         # Trim anything after Product Name/Trade name label fragments
-        manufacturer = re.split(r'\b(Product\s+Name|Trade\s+name)\b', manufacturer, flags=re.IGNORECASE)[0].strip()
+        manufacturer = _RE_PRODUCT_LABEL_TAIL.split(manufacturer, maxsplit=1)[0].strip()
         manufacturer = strip_leading_label_prefix(dedup_repeated_phrase(manufacturer))
         # Final pass through company cleaner to trim ABN/FORMERLY parentheses and clip at suffixes
         try:
             manufacturer = fe_clean_company(manufacturer)
         except Exception:
             pass
-    result['manufacturer'] = {'value': manufacturer, 'confidence': 1.0 if manufacturer else 0.0}
     
     # Product description (NEW FIELD - from Section 1 only)
     description = extract_description(section1)
-    result['description'] = {'value': description, 'confidence': 1.0 if description else 0.0}
 
     # Product use (keeping existing for compatibility)
     product_use = extract_field_value(text, [
@@ -873,7 +1370,6 @@ def parse_pdf(path: Path) -> Dict[str, Any]:
         r'Product\s+use',
         r'Relevant\s+identified\s+uses'
     ], section1)
-    result['product_use'] = {'value': product_use, 'confidence': 1.0 if product_use else 0.0}
     
     # Dangerous goods class (from Section 14) - RESTORE WORKING LOGIC
     # Prefer modular Section 14 extractor; fallback to legacy patterns
@@ -902,11 +1398,9 @@ def parse_pdf(path: Path) -> Dict[str, Any]:
         logger.warning("Invalid DG class rejected: '%s'", dg_class)
         dg_class = None
     
-    result['dangerous_goods_class'] = {'value': dg_class, 'confidence': 1.0 if dg_class else 0.0}
     
     # Subsidiary risk
     subsidiary_risk = extract_field_value(text, [r'Subsidiary\s+risk'], section14)
-    result['subsidiary_risk'] = {'value': subsidiary_risk, 'confidence': 1.0 if subsidiary_risk else 0.0}
     
     # Packing group - RESTORE WORKING LOGIC + ADD TABLE SUPPORT
     # Packing group via modular extractor, with fallbacks
@@ -926,40 +1420,77 @@ def parse_pdf(path: Path) -> Dict[str, Any]:
         packing_group = extract_packing_group_from_table(section14)
     # Normalize duplicated values like "II II" -> "II"
     if packing_group:
-        toks = [t for t in re.split(r'\s+', packing_group) if t]
+        toks = packing_group.split()
         if toks and all(t.upper() == toks[0].upper() for t in toks):
             packing_group = toks[0]
     
-    result['packing_group'] = {'value': packing_group, 'confidence': 1.0 if packing_group else 0.0}
     
     # Issue date - ENHANCED EXTRACTION
     issue_date = extract_date(text)
-    result['issue_date'] = {'value': issue_date, 'confidence': 1.0 if issue_date else 0.0}
+    if not issue_date and partial:
+        # Revision dates are often only in Section 16 or the footers of the skipped pages
+        if full_text is None:
+            full_text = extract_text_from_pdf(path)
+        issue_date = extract_date(full_text)
     
+    fields = {
+        'product_name': product_name,
+        'manufacturer': manufacturer,
+        'description': description,
+        'product_use': product_use,
+        'dangerous_goods_class': dg_class,
+        'subsidiary_risk': subsidiary_risk,
+        'packing_group': packing_group,
+        'issue_date': issue_date,
+    }
+
     # Final validation - remove any remaining noise (BE MORE CONSERVATIVE)
-    label_like_pattern = re.compile(r'(product\s+identifier|product\s+name|trade\s+name|commercial\s+product\s+name)\s*$', re.IGNORECASE)
-    header_like_pattern = re.compile(r'^\s*\d+\.?\s*(identification|hazard)\b', re.IGNORECASE)
     for field_name in ['product_name', 'manufacturer']:
-        val = result[field_name]['value']
-        if val and (is_noise_text(val) or label_like_pattern.fullmatch(str(val).strip() or '') or (field_name == 'product_name' and header_like_pattern.match(str(val)))):
+        val = fields[field_name]
+        if val and (is_noise_text(val) or _RE_FINAL_LABEL_LIKE.fullmatch(str(val).strip() or '') or (field_name == 'product_name' and _RE_FINAL_HEADER_LIKE.match(str(val)))):
             logger.warning(f"Final validation rejected {field_name}: '{val}'")
-            result[field_name] = {'value': None, 'confidence': 0.0}
+            fields[field_name] = None
+
+    # Every field is reported as {'value', 'confidence'}, built once here
+    result.update((name, {'value': value, 'confidence': 1.0 if value else 0.0}) for name, value in fields.items())
     
     # Log results
     logger.info("Extraction complete:")
     for field in ['product_name', 'manufacturer', 'description', 'dangerous_goods_class', 'issue_date']:
-        value = result[field].get('value')
+        value = fields[field]
         logger.info(f"  {field}: '{value if value is not None else 'None'}'")
     
     return result
 
 
+def _parse_pdf_for_batch(path: str) -> Dict[str, Any]:
+    """parse_pdf for one file of a CLI batch: errors become an entry instead of ending the run."""
+    if not Path(path).exists():
+        return {"error": f"{path} not found"}
+    try:
+        return parse_pdf(Path(path))
+    except Exception as e:
+        logger.exception(f"Parsing failed: {path}")
+        return {"error": str(e) or 'Unknown error'}
+
+
 if __name__ == '__main__':
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python sds_extractor.py <pdf_file>")
+        print("Usage: python sds_extractor.py <pdf_file> [<pdf_file> ...]")
         sys.exit(1)
+
+    if len(sys.argv) > 2:
+        # Several files: parse them in separate processes (one fitz/OCR pipeline each) and print
+        # one JSON object keyed by path
+        from concurrent.futures import ProcessPoolExecutor
+
+        paths = sys.argv[1:]
+        with ProcessPoolExecutor(max_workers=min(len(paths), AVAILABLE_CPUS)) as executor:
+            results = dict(zip(paths, executor.map(_parse_pdf_for_batch, paths)))
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        sys.exit(0)
     
     pdf_path = Path(sys.argv[1])
     if not pdf_path.exists():